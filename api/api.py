@@ -30,10 +30,10 @@ from api.models import (
 
 # Import service layer and wallet client
 from services.class_update_service import propagate_class_update_to_passes
-from services.google_wallet_service import WalletClient
+from services.google_wallet_service import get_wallet_client, without_review_status
 from exceptions import (
     WalletPassError, DatabaseError, DuplicateRecordError,
-    GoogleWalletError, ValidationError,
+    GoogleWalletError, GoogleWalletNotFoundError, ValidationError,
 )
 import logging
 
@@ -43,7 +43,7 @@ logger = logging.getLogger(__name__)
 
 # Initialize wallet client (will be used for class updates)
 try:
-    wallet_client = WalletClient()
+    wallet_client = get_wallet_client()
     logger.info("WalletClient initialized successfully")
 except Exception as e:
     wallet_client = None
@@ -346,23 +346,7 @@ async def update_class(class_id: str, class_data: ClassUpdate, sync_to_google: b
                 if key not in update_data and value is not None:
                     update_data[key] = value
 
-        # region agent log
-        try:
-            import json as _json, time as _time
-            with open("/home/slimanutd/sleiman/B2F/Projects/WalletPasses/.cursor/debug.log", "a") as _f:
-                _ts = int(_time.time() * 1000)
-                _f.write(_json.dumps({
-                    "id": f"log_{_ts}",
-                    "timestamp": _ts,
-                    "location": "api/api.py:update_class:before_db_update",
-                    "message": "About to update class in DB",
-                    "data": {"class_id": class_id, "update_keys": list(update_data.keys())},
-                    "runId": "initial",
-                    "hypothesisId": "H1"
-                }) + "\n")
-        except Exception:
-            pass
-        # endregion
+        logger.debug("Updating class '%s' in DB with keys: %s", class_id, list(update_data))
 
         # Remove class_id from update_data to avoid 'multiple values' error
         if "class_id" in update_data:
@@ -397,24 +381,6 @@ async def update_class(class_id: str, class_data: ClassUpdate, sync_to_google: b
                         class_data=updated_class['class_json'],
                         class_type=updated_class.get('class_type', 'Generic')
                     )
-
-                # region agent log
-                try:
-                    import json as _json, time as _time
-                    with open("/home/slimanutd/sleiman/B2F/Projects/WalletPasses/.cursor/debug.log", "a") as _f:
-                        _ts = int(_time.time() * 1000)
-                        _f.write(_json.dumps({
-                            "id": f"log_{_ts}",
-                            "timestamp": _ts,
-                            "location": "api/api.py:update_class:before_propagate",
-                            "message": "Calling propagate_class_update_to_passes",
-                            "data": {"class_id": class_id},
-                            "runId": "initial",
-                            "hypothesisId": "H1"
-                        }) + "\n")
-                except Exception:
-                    pass
-                # endregion
                 
                 # 3b: Propagate updates to all pass objects (triggers pass-level notifications)
                 logger.info(f"Propagating class '{class_id}' updates to affected passes")
@@ -426,23 +392,7 @@ async def update_class(class_id: str, class_data: ClassUpdate, sync_to_google: b
                     notification_message=notification_message
                 )
 
-                # region agent log
-                try:
-                    import json as _json, time as _time
-                    with open("/home/slimanutd/sleiman/B2F/Projects/WalletPasses/.cursor/debug.log", "a") as _f:
-                        _ts = int(_time.time() * 1000)
-                        _f.write(_json.dumps({
-                            "id": f"log_{_ts}",
-                            "timestamp": _ts,
-                            "location": "api/api.py:update_class:after_propagate",
-                            "message": "Finished propagate_class_update_to_passes",
-                            "data": propagation_result,
-                            "runId": "initial",
-                            "hypothesisId": "H2"
-                        }) + "\n")
-                except Exception:
-                    pass
-                # endregion
+                logger.debug("Propagation result for class '%s': %s", class_id, propagation_result)
                 
                 # Build response message
                 updated_count = propagation_result["updated_count"]
@@ -542,18 +492,7 @@ async def sync_classes_from_google():
                 
                 # Filter out reviewStatus from the class JSON to prevent it from being saved
                 # This ensures we don't overwrite local review status with "UNDER_REVIEW" from Google
-                def remove_review_status(obj):
-                    if isinstance(obj, dict):
-                        obj.pop('reviewStatus', None)
-                        for value in obj.values():
-                            remove_review_status(value)
-                    elif isinstance(obj, list):
-                        for item in obj:
-                            remove_review_status(item)
-                
-                import copy
-                clean_google_class = copy.deepcopy(google_class)
-                remove_review_status(clean_google_class)
+                clean_google_class = without_review_status(google_class)
                 
                 if existing_class:
                     # Update parameters
@@ -1110,26 +1049,17 @@ async def get_pass_from_google(object_id: str):
     if not wallet_client:
         raise HTTPException(status_code=503, detail="Google Wallet service not initialized")
 
-    full_object_id = f"{configs.ISSUER_ID}.{object_id}" if not object_id.startswith(configs.ISSUER_ID) else object_id
-
-    object_resources = [
-        ("Generic",     wallet_client.service.genericobject()),
-        ("EventTicket", wallet_client.service.eventticketobject()),
-        ("LoyaltyCard", wallet_client.service.loyaltyobject()),
-        ("GiftCard",    wallet_client.service.giftcardobject()),
-        ("TransitPass", wallet_client.service.transitobject()),
-    ]
-
-    for class_type, resource in object_resources:
-        try:
-            gw_obj = resource.get(resourceId=full_object_id).execute()
-            normalised = _normalize_google_pass(gw_obj)
-            normalised["class_type"] = class_type
-            return normalised
-        except Exception:
-            continue
+    try:
+        gw_obj, class_type = wallet_client.find_object(object_id)
+    except GoogleWalletNotFoundError:
+        raise HTTPException(status_code=404, detail=f"Pass '{object_id}' not found in Google Wallet")
+    except Exception as e:
+        logger.error(f"Error fetching pass '{object_id}' from Google Wallet: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
 
-    raise HTTPException(status_code=404, detail=f"Pass '{object_id}' not found in Google Wallet")
+    normalised = _normalize_google_pass(gw_obj)
+    normalised["class_type"] = class_type
+    return normalised
 
 
 @app.get("/passes/{object_id}", response_model=PassResponse, tags=["Passes"])
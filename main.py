@@ -10,7 +10,7 @@ import warnings
 warnings.filterwarnings("ignore", category=FutureWarning, module="google.api_core")
 os.environ["GDK_BACKEND"] = "x11"
 import flet as ft
-from services.google_wallet_service import WalletClient
+from services.google_wallet_service import get_wallet_client
 from services.api_client import APIClient
 from state.app_state import AppState
 from views.root_view import build_root_view
@@ -32,7 +32,7 @@ def main(page: ft.Page):
     # ── Initialise services ──
     wallet_client = None
     try:
-        wallet_client = WalletClient()
+        wallet_client = get_wallet_client()
     except Exception as e:
         print(f"⚠️  WalletClient init failed: {e}")
 
@@ -4,11 +4,12 @@ Provides domain services for business logic operations
 """
 
 from .class_update_service import propagate_class_update_to_passes
-from .google_wallet_service import WalletClient
+from .google_wallet_service import WalletClient, get_wallet_client
 from .api_client import APIClient
 
 __all__ = [
     'propagate_class_update_to_passes',
     'WalletClient',
+    'get_wallet_client',
     'APIClient',
 ]
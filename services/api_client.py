@@ -19,11 +19,13 @@ class APIClient:
             self.base_url = f"http://localhost:{port}"
         else:
             self.base_url = base_url
+        # One pooled session, so consecutive calls reuse the keep-alive connection
+        self._session = requests.Session()
     
     def get_classes(self) -> List[Dict[str, Any]]:
         """Fetch all available classes"""
         try:
-            response = requests.get(f"{self.base_url}/classes/")
+            response = self._session.get(f"{self.base_url}/classes/")
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -33,7 +35,7 @@ class APIClient:
     def get_class(self, class_id: str) -> Optional[Dict[str, Any]]:
         """Fetch a specific class by ID"""
         try:
-            response = requests.get(f"{self.base_url}/classes/{class_id}")
+            response = self._session.get(f"{self.base_url}/classes/{class_id}")
             if response.status_code == 404:
                 return None
             response.raise_for_status()
@@ -94,7 +96,7 @@ class APIClient:
         # filter out Nones
         data = {k: v for k, v in data.items() if v is not None}
         try:
-            response = requests.post(f"{self.base_url}/classes/", json=data)
+            response = self._session.post(f"{self.base_url}/classes/", json=data)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.HTTPError as e:
@@ -162,7 +164,7 @@ class APIClient:
             if notification_message:
                 params["notification_message"] = notification_message
             
-            response = requests.put(
+            response = self._session.put(
                 f"{self.base_url}/classes/{class_id}",
                 json=data,
                 params=params
@@ -203,7 +205,7 @@ class APIClient:
             "store_card_data": store_card_data or {}
         }
         try:
-            response = requests.post(f"{self.base_url}/passes/apple/", json=data)
+            response = self._session.post(f"{self.base_url}/passes/apple/", json=data)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.HTTPError as e:
@@ -233,7 +235,7 @@ class APIClient:
             "pass_data": pass_data or {}
         }
         try:
-            response = requests.post(f"{self.base_url}/passes/", json=data)
+            response = self._session.post(f"{self.base_url}/passes/", json=data)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.HTTPError as e:
@@ -254,7 +256,7 @@ class APIClient:
             url = f"{self.base_url}/passes/"
             if status:
                 url += f"?status={status}"
-            response = requests.get(url)
+            response = self._session.get(url)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -264,7 +266,7 @@ class APIClient:
     def get_pass(self, object_id: str) -> Optional[Dict[str, Any]]:
         """Fetch a specific pass by object ID"""
         try:
-            response = requests.get(f"{self.base_url}/passes/{object_id}")
+            response = self._session.get(f"{self.base_url}/passes/{object_id}")
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -274,7 +276,7 @@ class APIClient:
     def get_passes_by_class(self, class_id: str) -> List[Dict[str, Any]]:
         """Fetch all passes belonging to a specific class (from local DB)"""
         try:
-            response = requests.get(f"{self.base_url}/passes/class/{class_id}")
+            response = self._session.get(f"{self.base_url}/passes/class/{class_id}")
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -286,7 +288,7 @@ class APIClient:
         try:
             from urllib.parse import quote
             safe_email = quote(email)
-            response = requests.get(f"{self.base_url}/passes/email/{safe_email}")
+            response = self._session.get(f"{self.base_url}/passes/email/{safe_email}")
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -298,7 +300,7 @@ class APIClient:
     def get_passes_by_class_from_google(self, class_id: str) -> List[Dict[str, Any]]:
         """Fetch all passes for a class LIVE from Google Wallet API (no local DB)"""
         try:
-            response = requests.get(f"{self.base_url}/passes/google/class/{class_id}")
+            response = self._session.get(f"{self.base_url}/passes/google/class/{class_id}")
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -308,7 +310,7 @@ class APIClient:
     def get_pass_from_google(self, object_id: str) -> Optional[Dict[str, Any]]:
         """Fetch a single pass LIVE from Google Wallet API (no local DB)"""
         try:
-            response = requests.get(f"{self.base_url}/passes/google/object/{object_id}")
+            response = self._session.get(f"{self.base_url}/passes/google/object/{object_id}")
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -336,7 +338,7 @@ class APIClient:
         
         url = f"{self.base_url}/passes/{object_id}?sync_to_google={'true' if sync_to_google else 'false'}&send_notification={'true' if send_notification else 'false'}"
         try:
-            response = requests.put(url, json=data)
+            response = self._session.put(url, json=data)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.HTTPError as e:
@@ -354,7 +356,7 @@ class APIClient:
     def generate_save_link(self, object_id: str) -> str:
         """Generate a Google Wallet JWT save link for a given pass"""
         try:
-            response = requests.get(f"{self.base_url}/passes/{object_id}/save-link")
+            response = self._session.get(f"{self.base_url}/passes/{object_id}/save-link")
             response.raise_for_status()
             return response.json().get("save_link", "")
         except requests.exceptions.HTTPError as e:
@@ -372,7 +374,7 @@ class APIClient:
     def push_pass_to_google(self, object_id: str) -> Dict[str, Any]:
         """Push a pass to Google Wallet using the local database state"""
         try:
-            response = requests.post(f"{self.base_url}/passes/{object_id}/push")
+            response = self._session.post(f"{self.base_url}/passes/{object_id}/push")
             response.raise_for_status()
             return response.json()
         except requests.exceptions.HTTPError as e:
@@ -390,7 +392,7 @@ class APIClient:
     def sync_classes(self) -> Dict[str, Any]:
         """Trigger sync of all classes from Google Wallet to local database"""
         try:
-            response = requests.post(f"{self.base_url}/classes/sync")
+            response = self._session.post(f"{self.base_url}/classes/sync")
             response.raise_for_status()
             return response.json()
         except requests.exceptions.HTTPError as e:
@@ -408,7 +410,7 @@ class APIClient:
     def sync_passes(self) -> Dict[str, Any]:
         """Trigger sync of all pass objects from Google Wallet to local database"""
         try:
-            response = requests.post(f"{self.base_url}/passes/sync")
+            response = self._session.post(f"{self.base_url}/passes/sync")
             response.raise_for_status()
             return response.json()
         except requests.exceptions.HTTPError as e:
@@ -426,7 +428,7 @@ class APIClient:
     def check_health(self) -> Dict[str, Any]:
         """Check API health status"""
         try:
-            response = requests.get(f"{self.base_url}/health")
+            response = self._session.get(f"{self.base_url}/health")
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -435,7 +437,7 @@ class APIClient:
     def send_pass_notification(self, object_id: str, message: str) -> Dict[str, Any]:
         """Send a push notification to a specific pass holder"""
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/passes/{object_id}/notify",
                 json={"message": message}
             )
@@ -455,7 +457,7 @@ class APIClient:
     def send_class_notification(self, class_id: str, message: str) -> Dict[str, Any]:
         """Send a push notification to all holders of a template/class"""
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/classes/{class_id}/notify",
                 json={"message": message}
             )
@@ -474,7 +476,7 @@ class APIClient:
     def send_apple_pass_notification(self, serial_number: str, message: str) -> Dict[str, Any]:
         """Send a push notification via APNs to an Apple Wallet Pass"""
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/passes/apple/{serial_number}/notify",
                 json={"message": message}
             )
@@ -493,7 +495,7 @@ class APIClient:
     def send_apple_template_notification(self, template_id: str, message: str) -> Dict[str, Any]:
         """Send a push notification via APNs to all passes in an Apple template"""
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/templates/apple/{template_id}/notify",
                 json={"message": message}
             )
@@ -512,7 +514,7 @@ class APIClient:
     def get_apple_pass_devices_count(self, serial_number: str) -> int:
         """Fetch the number of registered devices for an Apple Wallet Pass"""
         try:
-            response = requests.get(f"{self.base_url}/passes/apple/{serial_number}/devices")
+            response = self._session.get(f"{self.base_url}/passes/apple/{serial_number}/devices")
             response.raise_for_status()
             return response.json().get("count", 0)
         except Exception as e:
@@ -526,7 +528,7 @@ class APIClient:
     def get_apple_templates(self) -> List[Dict[str, Any]]:
         """Fetch all available Apple Wallet templates"""
         try:
-            response = requests.get(f"{self.base_url}/templates/apple/")
+            response = self._session.get(f"{self.base_url}/templates/apple/")
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -536,7 +538,7 @@ class APIClient:
     def get_apple_template(self, template_id: str) -> Optional[Dict[str, Any]]:
         """Fetch a specific Apple template by ID"""
         try:
-            response = requests.get(f"{self.base_url}/templates/apple/{template_id}")
+            response = self._session.get(f"{self.base_url}/templates/apple/{template_id}")
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -556,7 +558,7 @@ class APIClient:
             **kwargs
         }
         try:
-            response = requests.post(f"{self.base_url}/templates/apple/", json=data)
+            response = self._session.post(f"{self.base_url}/templates/apple/", json=data)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.HTTPError as e:
@@ -568,7 +570,7 @@ class APIClient:
     def update_apple_template(self, template_id: str, **kwargs) -> Dict[str, Any]:
         """Update an existing Apple Wallet template"""
         try:
-            response = requests.put(f"{self.base_url}/templates/apple/{template_id}", json=kwargs)
+            response = self._session.put(f"{self.base_url}/templates/apple/{template_id}", json=kwargs)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.HTTPError as e:
@@ -580,7 +582,7 @@ class APIClient:
     def delete_apple_template(self, template_id: str) -> Dict[str, Any]:
         """Delete an Apple Wallet template"""
         try:
-            response = requests.delete(f"{self.base_url}/templates/apple/{template_id}")
+            response = self._session.delete(f"{self.base_url}/templates/apple/{template_id}")
             response.raise_for_status()
             return response.json()
         except requests.exceptions.HTTPError as e:
@@ -596,7 +598,7 @@ class APIClient:
     def get_all_apple_passes(self) -> List[Dict[str, Any]]:
         """Fetch all Apple Wallet passes"""
         try:
-            response = requests.get(f"{self.base_url}/passes/apple/")
+            response = self._session.get(f"{self.base_url}/passes/apple/")
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -606,7 +608,7 @@ class APIClient:
     def get_apple_pass(self, serial_number: str) -> Optional[Dict[str, Any]]:
         """Fetch a specific Apple pass by serial number"""
         try:
-            response = requests.get(f"{self.base_url}/passes/apple/{serial_number}")
+            response = self._session.get(f"{self.base_url}/passes/apple/{serial_number}")
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -616,7 +618,7 @@ class APIClient:
     def update_apple_pass(self, serial_number: str, **kwargs) -> Dict[str, Any]:
         """Update an existing Apple Wallet pass"""
         try:
-            response = requests.put(f"{self.base_url}/passes/apple/{serial_number}", json=kwargs)
+            response = self._session.put(f"{self.base_url}/passes/apple/{serial_number}", json=kwargs)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.HTTPError as e:
@@ -633,7 +635,7 @@ class APIClient:
     def get_campaigns(self) -> List[Dict[str, Any]]:
         """Fetch all QR campaigns"""
         try:
-            response = requests.get(f"{self.base_url}/campaigns/")
+            response = self._session.get(f"{self.base_url}/campaigns/")
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -643,7 +645,7 @@ class APIClient:
     def get_campaign(self, slug_or_id: str) -> Optional[Dict[str, Any]]:
         """Fetch a specific campaign"""
         try:
-            response = requests.get(f"{self.base_url}/campaigns/{slug_or_id}")
+            response = self._session.get(f"{self.base_url}/campaigns/{slug_or_id}")
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -665,7 +667,7 @@ class APIClient:
             "landing_subtitle": landing_subtitle
         }
         try:
-            response = requests.post(f"{self.base_url}/campaigns/", json=data)
+            response = self._session.post(f"{self.base_url}/campaigns/", json=data)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.HTTPError as e:
@@ -677,7 +679,7 @@ class APIClient:
     def update_campaign(self, campaign_id: int, **kwargs) -> Dict[str, Any]:
         """Update an existing QR campaign"""
         try:
-            response = requests.put(f"{self.base_url}/campaigns/{campaign_id}", json=kwargs)
+            response = self._session.put(f"{self.base_url}/campaigns/{campaign_id}", json=kwargs)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.HTTPError as e:
@@ -689,7 +691,7 @@ class APIClient:
     def delete_campaign(self, campaign_id: int) -> Dict[str, Any]:
         """Delete a QR campaign"""
         try:
-            response = requests.delete(f"{self.base_url}/campaigns/{campaign_id}")
+            response = self._session.delete(f"{self.base_url}/campaigns/{campaign_id}")
             response.raise_for_status()
             return response.json()
         except requests.exceptions.HTTPError as e:
@@ -1,166 +1,1071 @@
+import base64
 import copy
-import json 
-import os
+import functools
+import logging
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import quote
+from concurrent.futures import Future, ThreadPoolExecutor
+import google_auth_httplib2
+import httplib2
+import httpx
 from google.oauth2 import service_account
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
 from googleapiclient.errors import HttpError
+from googleapiclient.model import JsonModel
 import configs
 from exceptions import GoogleWalletAPIError, GoogleWalletNotFoundError, GoogleWalletError
-import jwt
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding
 import uuid
-from datetime import datetime, timedelta
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Per-request socket timeout (seconds) for the shared Wallet API transport
+HTTP_TIMEOUT = 30
+
+# How long (seconds) an ID that 404'd on every resource type is assumed missing
+MISSING_ID_TTL = 30
+
+# How long (seconds) a fetched class is served from memory; class writes made
+# through this client drop it immediately
+CLASS_CACHE_TTL = 300
+
+# How long (seconds) the pass type that served an ID is remembered; a stale
+# hint only costs one extra call before the full probe
+TYPE_HINT_TTL = 24 * 60 * 60
+
+# Statuses that mean "try again later" rather than a bad request, and how
+# many times (with exponential backoff, in seconds) such a call is retried
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 8
+# Inserts are not idempotent: a 5xx may come after the server created the
+# resource, so only a rate limit (rejected before processing) is retried
+INSERT_RETRY_STATUSES = frozenset({429})
+
+# Characters Google Wallet accepts in class/object resource IDs
+_RESOURCE_ID_PATTERN = re.compile(r"[A-Za-z0-9._-]+")
+
+# (class_type, discovery resource prefix) for every Wallet pass vertical,
+# in the order get_object/get_class probe them
+_PASS_TYPES = (
+    ("Generic", "generic"),
+    ("LoyaltyCard", "loyalty"),
+    ("Offer", "offer"),
+    ("GiftCard", "giftcard"),
+    ("TransitPass", "transit"),
+    ("Flight", "flight"),
+    ("EventTicket", "eventticket"),
+)
+
+# GenericClass fields Google actually persists; create_pass_class drops the rest
+_GENERIC_CLASS_KEYS = frozenset({
+    "id",
+    "issuerName",
+    "reviewStatus",
+    "hexBackgroundColor",
+    "logo",
+    "heroImage",
+    "header",
+    "cardTitle",
+    "barcode",
+    "textModulesData",
+    "linksModuleData",
+    "imageModulesData",
+    "classTemplateInfo",
+    "messages",
+    "multipleDevicesAndHoldersAllowedStatus",
+    "viewUnlockRequirement",
+    "callbackOptions",
+    "securityAnimation",
+    "enableSmartTap",
+    "redemptionIssuers",
+    "merchantLocations",
+    "valueAddedModuleData",
+    "appLinkData",
+})
+
+# Google Wallet only accepts these reviewStatus values on insert
+_ALLOWED_REVIEW_STATUSES = frozenset({"UNDER_REVIEW", "DRAFT", "APPROVED"})
+
+# Constant part of every notification message (see _notification_message)
+_MESSAGE_TEMPLATE = {"kind": "walletobjects#walletObjectMessage", "messageType": "TEXT_AND_NOTIFY"}
+
+# Order in which list_all_classes/list_class_objects report pass types
+_LIST_ORDER = ("Generic", "LoyaltyCard", "EventTicket", "GiftCard", "TransitPass", "Offer", "Flight")
+
+# Google Wallet object states a local pass status may map onto
+_OBJECT_STATES = frozenset({"ACTIVE", "COMPLETED", "EXPIRED", "INACTIVE"})
+
+# Welcome message the builders attach (plus the requested messageType)
+_WELCOME_MESSAGE = {"header": "Welcome", "body": "Your pass has been created"}
+_LOYALTY_WELCOME_MESSAGE = {"header": "Welcome", "body": "Your loyalty card has been created"}
+
+# infoModulesData labels for known pass_data keys, per builder
+_EVENT_FIELD_LABELS = {
+    "event_time": "Event Time",
+    "seat_number": "Seat",
+    "seat": "Seat",
+    "section": "Section",
+    "row": "Row",
+    "gate": "Gate",
+    "venue": "Venue"
+}
+_LOYALTY_FIELD_LABELS = {
+    "tier_level": "Tier",
+    "tier": "Tier",
+    "points_balance": "Points Balance",
+    "points": "Points",
+    "rewards_available": "Available Rewards",
+    "expiry_date": "Expires"
+}
+
+# event_name/event_date come from the class, not the object
+_EVENT_SKIP_FIELDS = frozenset({"event_name", "event_date"})
+
+# pass_data keys that may hold an event seat, in priority order
+_SEAT_KEYS = ("seatNumber", "seat_number", "seat")
+
+# Event skip fields once the seat is read from `key`: the other seat aliases
+# would only repeat it as extra "Seat" columns
+_EVENT_SKIP_FIELDS_BY_SEAT_KEY = {
+    key: _EVENT_SKIP_FIELDS.union(alias for alias in _SEAT_KEYS if alias != key)
+    for key in _SEAT_KEYS
+}
+
+# member_since is shown as a text module instead
+_LOYALTY_SKIP_FIELDS = frozenset({"member_since"})
+
+# Generic pass_data keys already used in header, cardTitle, subheader, or textModules
+_GENERIC_SKIP_FIELDS = frozenset({
+    "card_title", "cardTitle", "header_value", "header", "subheader",
+    "subheader_value", "description", "textModulesData", "messages",
+    "messageType", "message_header", "message_body", "barcode",
+    "barcode_type", "barcode_value", "barcode_alt_text", "barcodeAltText", "logo_url", "logoUrl",
+    "hero_image_url", "heroImageUrl", "hero_url", "hexBackgroundColor",
+    "hex_background_color", "background_color", "base_color",
+})
+
+# Pass types with dedicated write paths; the rest are written as Generic
+_WRITE_PASS_TYPES = frozenset({"Generic", "EventTicket", "LoyaltyCard", "GiftCard", "TransitPass"})
+
+# Lookup scopes and the statuses that just mean "not this pass type":
+# classes of the wrong vertical answer 400 instead of 404
+_PROBE_MISS_STATUSES = {
+    "object": frozenset({404}),
+    "class": frozenset({404, 400}),
+}
+
+# Connection pool bounds for the shared HTTP/2 transport; kept above the
+# worker counts below so concurrent calls never wait for a socket
+HTTP_MAX_CONNECTIONS = 32
+# Seconds an idle pooled connection is kept open for reuse
+HTTP_KEEPALIVE_EXPIRY = 60
+# Times a failed TCP/TLS connect is retried before the request fails
+HTTP_CONNECT_RETRIES = 2
+
+# Seconds a signed save link is reused for the same pass before re-signing
+SAVE_LINK_TTL = 50 * 60
+
+# Partial-response mask for the current-state read in update_pass_object
+UPDATE_READ_FIELDS = "messages,cardTitle,textModulesData"
+
+# Save-link JWT payload key per class_type; other types are saved as Generic
+_SAVE_PAYLOAD_KEYS = {
+    "EventTicket": "eventTicketObjects",
+    "LoyaltyCard": "loyaltyObjects",
+    "GiftCard": "giftCardObjects",
+    "TransitPass": "transitObjects",
+    "Generic": "genericObjects",
+}
+
+# Calls per BatchHttpRequest; larger fan-outs are split across several batches
+BATCH_MAX_CALLS = 50
+
+# Batches of one list fan-out sent concurrently (kept well under the API's quotas)
+LIST_MAX_WORKERS = 8
+
+# Pass updates update_pass_objects runs at once
+UPDATE_MAX_WORKERS = 8
+
+
+class _TTLCache:
+    """Small thread-safe mapping whose entries expire after `ttl` seconds."""
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+
+class _HttpxTransport:
+    """
+    httplib2.Http-compatible transport backed by a single pooled HTTP/2
+    httpx client.
+
+    googleapiclient and google-auth-httplib2 only ever call `request()`, so
+    this drops in under AuthorizedHttp. Unlike httplib2.Http the client is
+    thread-safe, and concurrent Wallet calls are multiplexed over one
+    TLS connection instead of each queuing for its own HTTP/1.1 socket.
+    """
+
+    def __init__(self, timeout=HTTP_TIMEOUT):
+        self.timeout = timeout
+        self._client = httpx.Client(
+            timeout=timeout,
+            transport=httpx.HTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=HTTP_MAX_CONNECTIONS,
+                    keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+                ),
+                retries=HTTP_CONNECT_RETRIES,
+            ),
+        )
+
+    def request(self, uri, method="GET", body=None, headers=None,
+                redirections=httplib2.DEFAULT_MAX_REDIRECTS, connection_type=None):
+        try:
+            response = self._client.request(
+                method, uri, content=body, headers=headers,
+                follow_redirects=redirections > 0,
+            )
+        except httpx.TimeoutException as e:
+            # Surface transport failures as the exceptions googleapiclient retries on
+            raise TimeoutError(str(e)) from e
+        except httpx.TransportError as e:
+            raise ConnectionError(str(e)) from e
+
+        resp = httplib2.Response({"status": response.status_code, **response.headers})
+        resp.reason = response.reason_phrase
+        return resp, response.content
+
+
+def without_review_status(node):
+    """
+    Copy of a JSON-like class body with every `reviewStatus` key removed.
+
+    Copies and strips in a single pass, which is several times faster than
+    deepcopy followed by a second walk, and leaves the input untouched.
+    """
+    if isinstance(node, dict):
+        return {key: without_review_status(value) for key, value in node.items() if key != 'reviewStatus'}
+    if isinstance(node, list):
+        return [without_review_status(item) for item in node]
+    return node
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_label(key):
+    """Display label for a pass_data key without a known label ("member_tier" -> "Member Tier")."""
+    return key.replace("_", " ").title()
+
+
+def _info_label_values(pass_data, field_labels, skip_fields):
+    """
+    infoModulesData columns for every truthy pass_data field not in
+    `skip_fields`, in pass_data order. Known keys use their label from
+    `field_labels`; the rest are title-cased from the key.
+    """
+    get_label = field_labels.get
+    return [
+        {"label": get_label(key) or _format_label(key), "value": str(value)}
+        for key, value in pass_data.items()
+        if value and key not in skip_fields
+    ]
+
+
+def _localized_string(value):
+    """Wallet LocalizedString (en-US) holding `value` as text."""
+    return {
+        "kind": "walletobjects#localizedString",
+        "defaultValue": {
+            "kind": "walletobjects#translatedString",
+            "language": "en-US",
+            "value": str(value)
+        }
+    }
+
+
+def _en_us(value):
+    """Wallet LocalizedString with just an en-US defaultValue (no `kind` tags)."""
+    return {"defaultValue": {"language": "en-US", "value": value}}
+
+
+def _image(uri, description):
+    """Wallet Image for `uri` with an en-US content description."""
+    return {"sourceUri": {"uri": uri}, "contentDescription": _en_us(description)}
+
+
+def _localized_value(resource, key):
+    """Text of the LocalizedString at `resource[key]`, or None when unset."""
+    localized = resource.get(key)
+    if not localized:
+        return None
+    default_value = localized.get("defaultValue")
+    return default_value.get("value") if default_value else None
+
+
+def _object_state(status):
+    """Wallet object state for a local pass status; anything unknown is ACTIVE."""
+    if status:
+        s_upper = status.upper()
+        if s_upper in _OBJECT_STATES:
+            return s_upper
+    return "ACTIVE"
+
+
+def _hex_color(value):
+    """Stripped "#rrggbb"-style color from a UI value ("#" added to bare 3/6-digit hex), or None."""
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    if not value.startswith("#") and len(value) in [3, 6]:
+        value = f"#{value}"
+    return value
+
+
+def _barcode(pd):
+    """
+    Wallet barcode from pass_data: an explicit `barcode` dict, else one built
+    from the barcode_type/value/alt_text fields (QR_CODE by default). None
+    when there is no non-blank string value.
+    """
+    barcode_obj = None
+    if isinstance(pd.get("barcode"), dict):
+        barcode_obj = pd.get("barcode")
+    else:
+        bc_type = pd.get("barcode_type") or pd.get("barcodeType")
+        bc_value = pd.get("barcode_value") or pd.get("barcodeValue")
+        if (isinstance(bc_type, str) and bc_type.strip()) or (isinstance(bc_value, str) and bc_value.strip()):
+            barcode_obj = {
+                "type": bc_type if bc_type else "QR_CODE",
+                "value": bc_value if bc_value else "",
+            }
+            bc_alt = pd.get("barcode_alt_text") or pd.get("barcodeAltText")
+            if bc_alt:
+                barcode_obj["alternateText"] = str(bc_alt)
+    if isinstance(barcode_obj, dict) and isinstance(barcode_obj.get("value"), str) and barcode_obj["value"].strip():
+        return barcode_obj
+    return None
+
+
+def _utc_iso(epoch_seconds):
+    """UTC ISO-8601 timestamp ("...Z") for an integer epoch, as Wallet dates expect."""
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(epoch_seconds))
+
+
+def _notification_message(header, body, message_id, now_ts, duration=3600, message_type="TEXT_AND_NOTIFY"):
+    """
+    Wallet message that triggers a push notification.
+
+    Shown from a minute before `now_ts` for `duration` seconds.
+    """
+    message = dict(_MESSAGE_TEMPLATE, header=header, body=body, id=message_id, messageType=message_type)
+    message["displayInterval"] = {
+        "start": {"date": _utc_iso(now_ts - 60)},
+        "end": {"date": _utc_iso(now_ts + duration)}
+    }
+    return message
+
+
+def _message_patch_body(existing_messages, new_message):
+    """
+    Minimal patch that appends `new_message` to an object's messages.
+
+    groupingId is rotated too, which forces Android to re-evaluate the pass.
+    """
+    return {
+        "state": "ACTIVE",
+        "groupingId": f"group_{int(time.time())}",
+        "messages": list(existing_messages) + [new_message]
+    }
+
+
+def _write_pass_type(class_type):
+    """Pass type `class_type` is written as; types without a builder fall back to Generic."""
+    return class_type if class_type in _WRITE_PASS_TYPES else "Generic"
+
+
+def _next_page_token(response):
+    """Token for the next page of a Wallet list() response, if any."""
+    return (response.get("pagination") or {}).get("nextPageToken")
+
+
+def _retry_delay(error, attempt):
+    """
+    Seconds to wait before retrying after `error`: the server's Retry-After
+    when it sends one, else capped exponential backoff with jitter.
+    """
+    retry_after = error.resp.get("retry-after")
+    if retry_after:
+        try:
+            return min(float(retry_after), RETRY_MAX_DELAY)
+        except ValueError:
+            pass  # an HTTP-date; use our own backoff
+    return min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt) + random.uniform(0, RETRY_BASE_DELAY)
+
+
+def _with_retries(call, statuses=RETRY_STATUSES):
+    """
+    Run `call()`, retrying up to MAX_RETRIES times on rate limits and
+    transient server errors (`statuses`, RETRY_STATUSES by default). Other
+    errors, and the last retryable one, are raised unchanged.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            return call()
+        except HttpError as e:
+            if e.resp.status not in statuses or attempt == MAX_RETRIES:
+                raise
+            delay = _retry_delay(e, attempt)
+            logger.warning("Wallet API returned %s, retrying in %.1fs", e.resp.status, delay)
+            time.sleep(delay)
+
+
+def _json_loads(content):
+    """Decode a JSON response body with orjson."""
+    return orjson.loads(content)
+
+
+def _json_pretty(body):
+    """Indented JSON text of `body` for logs and error messages."""
+    return orjson.dumps(body, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+
+def _json_dumps(body):
+    """Encode a request body to UTF-8 JSON bytes with orjson."""
+    return orjson.dumps(body)
+
+
+class _FastJsonModel(JsonModel):
+    """
+    JsonModel that decodes Wallet API responses with `_json_loads`.
+
+    Request bodies keep the stdlib encoder on purpose: googleapiclient sets
+    Content-Length (also per batch part) from len() of the serialized str,
+    which is only the byte length for the ASCII-only output of
+    json.dumps(ensure_ascii=True). orjson emits raw UTF-8.
+    """
+
+    def deserialize(self, content):
+        try:
+            body = _json_loads(content)
+        except ValueError:
+            return content.decode("utf-8") if isinstance(content, bytes) else content
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+        return body
+
+
+@functools.lru_cache(maxsize=1)
+def _load_discovery_document():
+    """
+    Load the walletobjects v1 discovery document from the copy bundled with
+    google-api-python-client, so building the service never needs a network
+    round-trip to the discovery endpoint.
+    """
+    document = get_static_doc('walletobjects', 'v1')
+    if document is None:
+        raise GoogleWalletError("walletobjects v1 discovery document is not bundled with googleapiclient")
+    return _json_loads(document)
+
+
+def _get_url_template(resource_name, method="get"):
+    """
+    Absolute URL template of `<resource_name>.<method>` from the discovery
+    document, e.g. ".../walletobjects/v1/genericObject/{resourceId}".
+    """
+    document = _load_discovery_document()
+    path = document["resources"][resource_name]["methods"][method]["path"]
+    return document["rootUrl"] + document["servicePath"] + path
+
+
+@functools.lru_cache(maxsize=4096)
+def _ids_to_try(input_id, issuer_id):
+    """
+    Candidate Resource IDs for `input_id`, most likely first.
+
+    Memoized per (input_id, issuer_id) since the same IDs are resolved over
+    and over; returns a tuple so cached results can't be mutated.
+    """
+    clean_id = input_id.strip()
+    issuer_prefix = f"{issuer_id}."
+
+    # 1. Ideal scenario: The input ID already starts with the Issuer ID
+    if clean_id.startswith(issuer_prefix):
+        return (clean_id,)
+
+    # 2. Common scenario: User entered only the Suffix (Name).
+    # Resource IDs are always "<issuerId>.<suffix>", so a raw suffix without
+    # a dot can never match and is not worth a round-trip.
+    # 3. Dotted ID from another issuer: keep the raw input as a fallback
+    if "." in clean_id:
+        return (issuer_prefix + clean_id, clean_id)
+    return (issuer_prefix + clean_id,)
+
+
+@functools.lru_cache(maxsize=1)
+def _service_account_info():
+    """
+    Parsed service account key file, read once per process and shared by
+    the API credentials and the save-link signer.
+    """
+    try:
+        with open(configs.KEY_FILE_PATH, 'rb') as f:
+            return _json_loads(f.read())
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Credentials file not found: {configs.KEY_FILE_PATH}") from e
+
+
+@functools.lru_cache(maxsize=1)
+def _signing_key():
+    """
+    Load the service account's RSA private key once per process.
+
+    Returns a cryptography key object, so save links are signed
+    without re-reading the key file or re-parsing the PEM each time.
+    """
+    return serialization.load_pem_private_key(
+        _service_account_info()['private_key'].encode('utf-8'), password=None)
+
+
+def _b64url(data):
+    """Unpadded base64url, as JWTs use."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# Save-link JWTs always carry the same JOSE header
+_JWT_HEADER_B64 = _b64url(b'{"alg":"RS256","typ":"JWT"}')
+
+
+def _encode_jwt(claims):
+    """
+    RS256-sign `claims` into a compact JWT with the service account key.
+
+    The header segment is constant, so each token costs one JSON encode of
+    the claims and one RSA signature.
+    """
+    signing_input = _JWT_HEADER_B64 + b"." + _b64url(_json_dumps(claims))
+    signature = _signing_key().sign(signing_input, padding.PKCS1v15(), hashes.SHA256())
+    return (signing_input + b"." + _b64url(signature)).decode("ascii")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_service():
+    """
+    Build the Wallet Objects credentials and service once per process.
+
+    The service wraps a single authorized HTTP/2 transport, so every
+    WalletClient and thread reuses the same pooled connection to Google
+    instead of paying a fresh TCP + TLS handshake per client.
+
+    Returns:
+        Tuple of (credentials, authorized http, service)
+    """
+    credentials = service_account.Credentials.from_service_account_info(
+        _service_account_info(), scopes=configs.SCOPES)
+    # Refresh the access token in the background once it nears expiry, so
+    # requests keep using the current token instead of all blocking (and
+    # racing) on a refresh at the expiry boundary.
+    credentials.with_non_blocking_refresh()
+    http = google_auth_httplib2.AuthorizedHttp(credentials, http=_HttpxTransport())
+    document = _load_discovery_document()
+    model = _FastJsonModel("dataWrapper" in document.get("features", []))
+    service = build_from_document(document, http=http, model=model)
+    return credentials, http, service
+
+
+@functools.lru_cache(maxsize=1)
+def _get_resources():
+    """
+    Resource handles of the shared service, built once per process.
+
+    Every `service.<name>object()` factory call walks the discovery document
+    to build a new Resource, so these are made once and reused.
+
+    Returns:
+        Dict of scope ("object"/"class") -> {class_type: Resource}
+    """
+    _, _, service = _get_service()
+    return {
+        scope: {class_type: getattr(service, f"{name}{scope}")() for class_type, name in _PASS_TYPES}
+        for scope in _PROBE_MISS_STATUSES
+    }
+
 
 class WalletClient:
     def __init__(self):
         self.credentials = None
         self.service = None
+        # object_id -> classId seen on the last successful verify_pass
+        self._object_class_ids = _TTLCache(maxsize=8192, ttl=TYPE_HINT_TTL)
+        # full object ID -> (resp, content, uri) of the 404 for IDs that recently missed on every type
+        self._missing_objects = _TTLCache(maxsize=8192, ttl=MISSING_ID_TTL)
+        # full class ID -> not-found message for classes that recently missed everywhere
+        self._missing_classes = _TTLCache(maxsize=8192, ttl=MISSING_ID_TTL)
+        # full class ID -> class returned by a recent get_class
+        self._classes = _TTLCache(maxsize=1024, ttl=CLASS_CACHE_TTL)
+        # (payload key, object ID, class ID) -> signed save link for ID-only payloads
+        self._save_links = _TTLCache(maxsize=4096, ttl=SAVE_LINK_TTL)
+        # scope -> {resource ID -> class_type that last served it}, tried first next time
+        self._type_hints = {
+            scope: _TTLCache(maxsize=16384, ttl=TYPE_HINT_TTL) for scope in _PROBE_MISS_STATUSES
+        }
+        # (scope, resource ID) -> Future of a lookup that is currently running
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="wallet-client")
         self._authenticate()
 
-    def _list_all_pages(self, list_method, **kwargs):
+        # Written class_type -> (object builder, object resource, PATCH URL template)
+        # for update_pass_object; types without a dedicated builder use build_generic_object
+        builders = {"EventTicket": self.build_event_ticket_object, "LoyaltyCard": self.build_loyalty_object}
+        self._object_writers = {
+            class_type: (
+                builders.get(class_type, self.build_generic_object),
+                self._object_resources[class_type],
+                self._object_patch_urls[class_type],
+            )
+            for class_type in _WRITE_PASS_TYPES
+        }
+
+    def _http(self):
+        """Shared authorized transport; safe to use from any thread."""
+        return self._authorized_http
+
+    def _list_all_pages_batched(self, calls):
         """
-        Exhaust a Google Wallet `list()` method by following nextPageToken.
+        Exhaust several Google Wallet `list()` calls at once.
+
+        The first page of every call goes out in one BatchHttpRequest (one
+        round trip to the API's /batch endpoint); calls whose response carries
+        a next page token are re-batched until every call is exhausted.
+
+        Failures stay with the call they belong to: a part that hits a rate
+        limit or transient 5xx is retried on its own (see _with_retries), and
+        if a /batch request fails as a whole its calls are sent individually.
+        A call whose later page fails keeps the pages already collected and
+        is logged as partial.
 
         Args:
-            list_method: bound googleapiclient list method (e.g., resource.list)
-            **kwargs: parameters passed to list()
+            calls: list of (list_method, kwargs) pairs
 
         Returns:
-            List of resource dicts aggregated across all pages.
+            List aligned with `calls`: the aggregated resource dicts of each
+            call, or the exception its first page failed with.
         """
-        all_resources = []
-        page_token = None
+        results = [[] for _ in calls]
+        pending = {str(i): dict(kwargs) for i, (_, kwargs) in enumerate(calls)}
+
+        def _request(request_id):
+            list_method = calls[int(request_id)][0]
+            return list_method(**pending[request_id])
 
-        while True:
-            if page_token:
-                kwargs["pageToken"] = page_token
+        while pending:
+            next_pending = {}
+            # Calls to re-send on their own after the batches of this round
+            alone = []
+
+            def _record(request_id, response, exception):
+                index = int(request_id)
+                if exception is not None:
+                    if results[index]:
+                        logger.warning(
+                            "Listing call %d failed after %d resources, keeping the partial result: %s",
+                            index, len(results[index]), exception,
+                        )
+                    else:
+                        results[index] = exception
+                    return
+                results[index].extend(response.get("resources", []) or [])
+                page_token = _next_page_token(response)
+                if page_token:
+                    next_pending[request_id] = dict(pending[request_id], token=page_token)
+
+            def _collect(request_id, response, exception):
+                if isinstance(exception, HttpError) and exception.resp.status in RETRY_STATUSES:
+                    alone.append(request_id)
+                else:
+                    _record(request_id, response, exception)
+
+            def _execute_batch(request_ids):
+                batch = self.service.new_batch_http_request(callback=_collect)
+                for request_id in request_ids:
+                    batch.add(_request(request_id), request_id=request_id)
+                try:
+                    batch.execute(http=self._http())
+                except Exception as e:
+                    # The /batch call itself failed before any part was answered
+                    logger.warning("Batch list request failed (%s), sending its %d calls individually", e, len(request_ids))
+                    alone.extend(request_ids)
+
+            def _execute_alone(request_id):
+                try:
+                    return _with_retries(_request(request_id).execute), None
+                except Exception as e:
+                    return None, e
+
+            request_ids = list(pending)
+            chunks = [request_ids[start:start + BATCH_MAX_CALLS] for start in range(0, len(request_ids), BATCH_MAX_CALLS)]
+            if len(chunks) == 1:
+                _execute_batch(chunks[0])
             else:
-                # Ensure we don't accidentally reuse an old token
-                kwargs.pop("pageToken", None)
+                # Each batch is one blocking round trip; overlap them on a bounded pool.
+                # The shared transport is thread-safe and callbacks touch distinct keys.
+                with ThreadPoolExecutor(max_workers=min(LIST_MAX_WORKERS, len(chunks))) as pool:
+                    list(pool.map(_execute_batch, chunks))
 
-            resp = list_method(**kwargs).execute()
-            all_resources.extend(resp.get("resources", []) or [])
+            if alone:
+                with ThreadPoolExecutor(max_workers=min(LIST_MAX_WORKERS, len(alone))) as pool:
+                    for request_id, (response, exception) in zip(alone, pool.map(_execute_alone, alone)):
+                        _record(request_id, response, exception)
 
-            page_token = resp.get("nextPageToken")
-            if not page_token:
-                break
+            pending = next_pending
 
-        return all_resources
+        return results
 
     def _authenticate(self):
         """
         Authenticates with Google using the service account file.
-        Handles file path fallback if the default name is not found.
         """
-        
-        # Check if the key file exists at the default path
-        if not os.path.exists(configs.KEY_FILE_PATH):
-            # Try the alternative file name commonly used in your project
-            if os.path.exists(configs.KEY_FILE_PATH):
-                configs.KEY_FILE_PATH = configs.KEY_FILE_PATH
-            else:
-                raise FileNotFoundError(f"Credentials file not found: {configs.KEY_FILE_PATH}")
-            
-        self.credentials = service_account.Credentials.from_service_account_file(
-            configs.KEY_FILE_PATH, scopes=configs.SCOPES)
-        self.service = build('walletobjects', 'v1', credentials=self.credentials)
+        # Credentials and service are shared process-wide (see _get_service)
+        self.credentials, self._authorized_http, self.service = _get_service()
+
+        # Resource handles are shared process-wide too (see _get_resources)
+        self._resources = _get_resources()
+        self._object_resources = self._resources["object"]
+        self._class_resources = self._resources["class"]
+
+        # GET URL templates per scope and class type for _probe
+        self._get_urls = {
+            scope: {class_type: _get_url_template(f"{name}{scope}") for class_type, name in _PASS_TYPES}
+            for scope in _PROBE_MISS_STATUSES
+        }
+        self._object_patch_urls = {
+            class_type: _get_url_template(f"{name}object", "patch") for class_type, name in _PASS_TYPES
+        }
 
     def _prepare_ids_to_try(self, input_id):
         """
-        Smart helper to prepare a list of potential Resource IDs.
+        Smart helper to prepare the potential Resource IDs (see _ids_to_try).
         Automatically handles the Issuer ID prefix logic.
         """
-        clean_id = input_id.strip()
-        ids = []
+        return _ids_to_try(input_id, configs.ISSUER_ID)
 
-        # 1. Ideal scenario: The input ID already starts with the Issuer ID
-        if clean_id.startswith(configs.ISSUER_ID):
-            ids.append(clean_id)
-        
-        # 2. Common scenario: User entered only the Suffix (Name)
-        else:
-            # Priority 1: Try constructing the valid ID (Issuer.Suffix)
-            ids.append(f"{configs.ISSUER_ID}.{clean_id}")
-            # Priority 2: Try the raw input just in case (fallback)
-            ids.append(clean_id)
-            
-        return ids
+    def _write_resource(self, scope, class_type):
+        """
+        Cached resource that creates/updates/notifies `class_type` passes.
 
+        Only the types with dedicated builders are written natively; every
+        other type (Offer, Flight, unknown) is written as Generic.
+        """
+        return self._resources[scope][_write_pass_type(class_type)]
 
-    def get_object(self, object_id):
+    def _check_resource_id(self, resource_id):
         """
-        Iterates through all possible Object types (Loyalty, Generic, Event, etc.)
-        to find a match for the given Object ID.
+        Reject IDs that Google Wallet can never store before any network I/O.
+        Resource IDs may only contain alphanumerics, '.', '_' and '-'.
         """
-        resources = [
-            self.service.genericobject(),
-            self.service.loyaltyobject(),
-            self.service.offerobject(),
-            self.service.giftcardobject(),
-            self.service.transitobject(),
-            self.service.flightobject(),
-            self.service.eventticketobject()
-        ]
+        if not _RESOURCE_ID_PATTERN.fullmatch(resource_id.strip()):
+            raise GoogleWalletNotFoundError(f"Invalid Google Wallet ID: {resource_id!r}")
 
-        # Prepare ID variations (Raw vs Prefixed)
-        ids_to_try = self._prepare_ids_to_try(object_id)
-        
+
+    def _get_by_url(self, url_template, resource_id):
+        """
+        GET a single resource straight through the authorized transport.
+
+        Skips googleapiclient's request builder on _probe's hinted path, which
+        runs on every lookup of an already-known ID. Failures raise the same
+        HttpError that `.execute()` would.
+        """
+        uri = url_template.format(resourceId=quote(resource_id, safe=""))
+        resp, content = self._http().request(uri, "GET")
+        if resp.status >= 300:
+            raise HttpError(resp, content, uri=uri)
+        return _json_loads(content)
+
+    def _patch_by_url(self, url_template, resource_id, body):
+        """
+        PATCH a single resource with a body pre-encoded by `_json_dumps`.
+
+        Going through the authorized transport directly lets the body stay
+        UTF-8 bytes, so Content-Length is the real byte count (unlike
+        googleapiclient's len() of the str). Failures raise HttpError.
+        """
+        uri = url_template.format(resourceId=quote(resource_id, safe=""))
+        resp, content = self._http().request(
+            uri, "PATCH", body=_json_dumps(body), headers={"content-type": "application/json"}
+        )
+        if resp.status >= 300:
+            raise HttpError(resp, content, uri=uri)
+        return _json_loads(content)
+
+    def _probe(self, scope, ids_to_try, class_type=None):
+        """
+        Shared lookup loop behind get_object ("object") and get_class ("class").
+
+        Tries every candidate ID against every pass type and returns the first
+        hit. The caller's `class_type` (or else the type that served an ID
+        last time) is tried alone first, so known IDs resolve in one call;
+        the remaining candidates then go out together (see _probe_batched).
+        Statuses in _PROBE_MISS_STATUSES[scope] mean "not this type" and
+        move on; rate limits and transient 5xx are retried with backoff (see
+        _with_retries); anything else is raised. If every attempt misses, the
+        last HttpError is raised.
+        """
+        miss_statuses = _PROBE_MISS_STATUSES[scope]
+        urls = self._get_urls[scope]
+        type_hints = self._type_hints[scope]
+        missed = set()
         last_error = None
-        
-        for oid in ids_to_try:
-            # Optional: print(f"Trying Object ID: {oid}") 
-            for resource in resources:
+
+        for resource_id in ids_to_try:
+            first_type = class_type or type_hints.get(resource_id)
+            if first_type not in urls:
+                continue
+            logger.debug("Trying %s ID: %s (%s)", scope, resource_id, first_type)
+            try:
+                resource = _with_retries(lambda: self._get_by_url(urls[first_type], resource_id))
+            except HttpError as e:
+                if e.resp.status not in miss_statuses:
+                    raise
+                # A stale hint would cost this extra call on every later lookup
+                if type_hints.get(resource_id) == first_type:
+                    type_hints.pop(resource_id)
+                missed.add((resource_id, first_type))
+                last_error = e
+                continue
+            type_hints.set(resource_id, first_type)
+            return resource
+
+        return self._probe_batched(scope, ids_to_try, missed, last_error)
+
+    def _probe_batched(self, scope, ids_to_try, missed=frozenset(), last_error=None):
+        """
+        Cold-lookup half of _probe.
+
+        Every (ID, type) candidate not already in `missed` goes out in a
+        single BatchHttpRequest, so a lookup that would walk up to 14 serial
+        404s costs one round trip. If the batch call itself fails, the same
+        GETs are sent concurrently instead. Outcomes are then read in the
+        serial loop's order, so the result (or the error raised) is the same
+        as trying them one by one.
+        """
+        resources = self._resources[scope]
+        urls = self._get_urls[scope]
+        candidates = [
+            (rid, rtype) for rid in ids_to_try for rtype in resources if (rid, rtype) not in missed
+        ]
+        outcomes = {}
+
+        def _collect(request_id, response, exception):
+            outcomes[int(request_id)] = (response, exception)
+
+        batch = self.service.new_batch_http_request(callback=_collect)
+        for index, (resource_id, resource_type) in enumerate(candidates):
+            batch.add(resources[resource_type].get(resourceId=resource_id), request_id=str(index))
+        if candidates:
+            try:
+                batch.execute(http=self._http())
+            except Exception as e:
+                # The /batch call itself failed (not one of its parts): send
+                # the same GETs side by side, still one round trip wall-clock
+                logger.warning("Batch %s probe failed (%s), probing concurrently", scope, e)
+                outcomes.clear()
+
+                def _get(candidate):
+                    resource_id, resource_type = candidate
+                    try:
+                        return self._get_by_url(urls[resource_type], resource_id), None
+                    except Exception as error:
+                        return None, error
+
+                with ThreadPoolExecutor(max_workers=len(candidates)) as pool:
+                    outcomes.update(enumerate(pool.map(_get, candidates)))
+
+        miss_statuses = _PROBE_MISS_STATUSES[scope]
+        for index, (resource_id, resource_type) in enumerate(candidates):
+            response, exception = outcomes[index]
+            if isinstance(exception, HttpError) and exception.resp.status in RETRY_STATUSES:
+                # Only this part hit a rate limit / server error: retry it alone
                 try:
-                    return resource.get(resourceId=oid).execute()
+                    response, exception = _with_retries(
+                        lambda: self._get_by_url(urls[resource_type], resource_id)), None
                 except HttpError as e:
-                    if e.resp.status == 404:
-                        last_error = e
-                        continue
-                    else:
-                        raise e
-            
-        if last_error:
-            raise last_error
+                    exception = e
+            if exception is None:
+                self._type_hints[scope].set(resource_id, resource_type)
+                return response
+            if not isinstance(exception, HttpError) or exception.resp.status not in miss_statuses:
+                raise exception
+            last_error = exception
+
+        raise last_error
+
+    def _single_flight(self, key, fetch):
+        """
+        Run `fetch()` once for all threads asking for the same `key` at the
+        same time. Late callers wait for the running lookup and share its
+        result (the same dict) or exception instead of starting their own
+        probe cascade.
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = self._inflight[key] = Future()
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            result = fetch()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
         else:
-             raise GoogleWalletNotFoundError("Unknown error fetching object")
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def get_object(self, object_id, class_type=None):
+        """
+        Iterates through all possible Object types (Loyalty, Generic, Event, etc.)
+        to find a match for the given Object ID.
+
+        Args:
+            object_id: Object ID (with or without issuer prefix)
+            class_type: Optional expected type (Generic, EventTicket, ...);
+                tried first, the other types are only probed if it misses
+        """
+        return self._single_flight(("object", object_id.strip()), lambda: self._fetch_object(object_id, class_type))
+
+    def find_object(self, object_id, class_type=None):
+        """
+        Look up a pass object like get_object and report which pass type
+        served it.
+
+        Args:
+            object_id: Object ID (with or without issuer prefix)
+            class_type: Optional expected type, tried first
+
+        Returns:
+            Tuple of (object dict, class_type)
 
-    def get_class(self, class_id):
+        Raises:
+            GoogleWalletNotFoundError: if no pass type has the object
+        """
+        try:
+            wallet_object = self.get_object(object_id, class_type)
+        except HttpError as e:
+            if e.resp.status not in _PROBE_MISS_STATUSES["object"]:
+                raise
+            raise GoogleWalletNotFoundError(f"Pass object '{object_id}' not found in Google Wallet") from e
+        object_type = self._type_hints["object"].get(wallet_object.get('id'))
+        return wallet_object, object_type or class_type or "Generic"
+
+    def _fetch_object(self, object_id, class_type=None):
+        # Prepare ID variations (Raw vs Prefixed)
+        self._check_resource_id(object_id)
+        ids_to_try = self._prepare_ids_to_try(object_id)
+
+        # Repeat lookups of an ID that just missed everywhere skip the probe storm
+        # (a fresh HttpError each time, so tracebacks don't pile up on one object)
+        known_missing = self._missing_objects.get(ids_to_try[0])
+        if known_missing:
+            resp, content, uri = known_missing
+            raise HttpError(resp, content, uri=uri)
+
+        try:
+            return self._probe("object", ids_to_try, class_type)
+        except HttpError as e:
+            if e.resp.status in _PROBE_MISS_STATUSES["object"]:
+                self._missing_objects.set(ids_to_try[0], (e.resp, e.content, e.uri))
+            raise
+
+    def get_class(self, class_id, class_type=None):
         """
         Iterates through all possible Class types (Templates) 
         to find a match for the given Class ID.
+
+        Args:
+            class_id: Class ID (with or without issuer prefix)
+            class_type: Optional expected type (Generic, EventTicket, ...);
+                tried first, the other types are only probed if it misses
+
+        Classes are kept for CLASS_CACHE_TTL seconds, so many objects of one
+        class cost one class fetch. The returned dict is shared; don't mutate it.
         """
-        resources = [
-            self.service.genericclass(),
-            self.service.loyaltyclass(),
-            self.service.offerclass(),
-            self.service.giftcardclass(),
-            self.service.transitclass(),
-            self.service.flightclass(),
-            self.service.eventticketclass()
-        ]
+        return self._single_flight(("class", class_id.strip()), lambda: self._fetch_class(class_id, class_type))
 
+    def _fetch_class(self, class_id, class_type=None):
         # Prepare ID variations (Raw vs Prefixed)
+        self._check_resource_id(class_id)
         ids_to_try = self._prepare_ids_to_try(class_id)
-        last_error = None
 
-        for cid in ids_to_try:
-            print(f"Trying Class ID: {cid}")
-            for resource in resources:
-                try:
-                    return resource.get(resourceId=cid).execute()
-                except HttpError as e:
-                    # Handle both 404 (not found) and 400 (wrong class type)
-                    if e.resp.status in [404, 400]:
-                        last_error = e
-                        continue
-                    else:
-                        raise e
-        
-        if last_error:
+        cached_class = self._classes.get(ids_to_try[0])
+        if cached_class is not None:
+            return cached_class
+
+        # Repeat lookups of a class that just missed everywhere skip the probe storm
+        known_missing = self._missing_classes.get(ids_to_try[0])
+        if known_missing:
+            raise GoogleWalletNotFoundError(known_missing)
+
+        try:
+            wallet_class = self._probe("class", ids_to_try, class_type)
+        except HttpError as e:
+            if e.resp.status not in _PROBE_MISS_STATUSES["class"]:
+                raise
             # Decode error content for better debugging in the UI
-            error_content = last_error.content.decode('utf-8') if hasattr(last_error, 'content') else str(last_error)
-            raise GoogleWalletNotFoundError(f"Google Error (404): Class not found.\nTried IDs: {ids_to_try}\nDetails: {error_content}")
-        else:
-             raise GoogleWalletNotFoundError("Unknown error fetching class")
+            error_content = e.content.decode('utf-8') if hasattr(e, 'content') else str(e)
+            message = f"Google Error (404): Class not found.\nTried IDs: {list(ids_to_try)}\nDetails: {error_content}"
+            self._missing_classes.set(ids_to_try[0], message)
+            raise GoogleWalletNotFoundError(message) from e
+        self._classes.set(ids_to_try[0], wallet_class)
+        return wallet_class
+
+    def _forget_class(self, class_id):
+        """Drop `class_id` from the get_class caches after writing to it."""
+        full_class_id = self._prepare_ids_to_try(class_id)[0]
+        self._classes.pop(full_class_id)
+        self._missing_classes.pop(full_class_id)
     
     def list_all_classes(self):
         """
@@ -172,30 +1077,23 @@ class WalletClient:
         all_classes = []
         
         # Define class types and their corresponding resources
-        class_types = [
-            ("Generic", self.service.genericclass()),
-            ("LoyaltyCard", self.service.loyaltyclass()),
-            ("EventTicket", self.service.eventticketclass()),
-            ("GiftCard", self.service.giftcardclass()),
-            ("TransitPass", self.service.transitclass()),
-            ("Offer", self.service.offerclass()),
-            ("Flight", self.service.flightclass()),
-        ]
+        class_types = [(class_type, self._class_resources[class_type]) for class_type in _LIST_ORDER]
         
-        for class_type, resource in class_types:
-            try:
-                # List classes of this type
-                classes = self._list_all_pages(resource.list, issuerId=configs.ISSUER_ID)
-                for cls in classes:
-                    # Add class type information
-                    cls['class_type'] = class_type
-                    all_classes.append(cls)
-                        
-            except HttpError as e:
+        # One batched round trip for all class types
+        results = self._list_all_pages_batched(
+            [(resource.list, {"issuerId": configs.ISSUER_ID}) for _, resource in class_types]
+        )
+
+        for (class_type, _), classes in zip(class_types, results):
+            if isinstance(classes, Exception):
                 # Skip if this class type has no resources or error
-                if e.resp.status != 404:
-                    print(f"Warning: Error listing {class_type} classes: {e}")
+                if not (isinstance(classes, HttpError) and classes.resp.status == 404):
+                    print(f"Warning: Error listing {class_type} classes: {classes}")
                 continue
+            for cls in classes:
+                # Add class type information
+                cls['class_type'] = class_type
+                all_classes.append(cls)
         
         return all_classes
 
@@ -215,54 +1113,46 @@ class WalletClient:
         # Step 1: Get all classes to know which ones exist
         try:
             all_classes = self.list_all_classes()
-            print(f"DEBUG: Found {len(all_classes)} classes to check for objects")
+            logger.debug("Found %d classes to check for objects", len(all_classes))
         except Exception as e:
             print(f"ERROR: Failed to fetch classes: {e}")
             return []
         
-        # Step 2: For each class, fetch its objects
+        # Step 2: Fetch the objects of every class in one batched round trip
+        listed_classes = []
         for cls in all_classes:
             class_id = cls.get('id')
             class_type = cls.get('class_type', 'Generic')
             
             # Map class type to the appropriate resource
-            resource_map = {
-                "EventTicket": self.service.eventticketobject(),
-                "LoyaltyCard": self.service.loyaltyobject(),
-                "Generic": self.service.genericobject(),
-                "GiftCard": self.service.giftcardobject(),
-                "TransitPass": self.service.transitobject()
-                ,
-                "Offer": self.service.offerobject(),
-                "Flight": self.service.flightobject(),
-            }
-            
-            resource = resource_map.get(class_type)
+            resource = self._object_resources.get(class_type)
             if not resource:
-                print(f"DEBUG: Unknown class type '{class_type}' for class {class_id}, skipping")
+                logger.debug("Unknown class type '%s' for class %s, skipping", class_type, class_id)
                 continue
-            
-            try:
-                # List objects for this specific class
-                print(f"DEBUG: Listing {class_type} objects for class {class_id}...")
-                objs = self._list_all_pages(resource.list, classId=class_id)
-                count = len(objs)
-                print(f"DEBUG: Found {count} {class_type} objects for class {class_id}")
-                for obj in objs:
-                    # Add object type information
-                    obj['class_type'] = class_type
-                    all_objects.append(obj)
-                        
-            except HttpError as e:
+            listed_classes.append((class_id, class_type, resource))
+
+        logger.debug("Listing objects for %d classes in batch...", len(listed_classes))
+        try:
+            results = self._list_all_pages_batched(
+                [(resource.list, {"classId": class_id}) for class_id, _, resource in listed_classes]
+            )
+        except Exception as e:
+            print(f"Error listing objects for classes: {e}")
+            return []
+
+        for (class_id, class_type, _), objs in zip(listed_classes, results):
+            if isinstance(objs, Exception):
                 # Skip if this class has no objects or error
-                if e.resp.status != 404:
-                    print(f"Warning: Error listing {class_type} objects for class {class_id}: {e}")
-                continue
-            except Exception as e:
-                print(f"Error listing {class_type} objects for class {class_id}: {e}")
+                if not (isinstance(objs, HttpError) and objs.resp.status == 404):
+                    print(f"Warning: Error listing {class_type} objects for class {class_id}: {objs}")
                 continue
+            logger.debug("Found %d %s objects for class %s", len(objs), class_type, class_id)
+            for obj in objs:
+                # Add object type information
+                obj['class_type'] = class_type
+                all_objects.append(obj)
         
-        print(f"DEBUG: Total objects found across all classes: {len(all_objects)}")
+        logger.debug("Total objects found across all classes: %d", len(all_objects))
         return all_objects
 
 
@@ -280,59 +1170,73 @@ class WalletClient:
         full_class_id = self._prepare_ids_to_try(class_id)[0]
         
         # Define object types and their corresponding resources
-        object_types = [
-            ("Generic", self.service.genericobject()),
-            ("LoyaltyCard", self.service.loyaltyobject()),
-            ("EventTicket", self.service.eventticketobject()),
-            ("GiftCard", self.service.giftcardobject()),
-            ("TransitPass", self.service.transitobject()),
-            ("Offer", self.service.offerobject()),
-            ("Flight", self.service.flightobject()),
-        ]
+        object_types = [(obj_type, self._object_resources[obj_type]) for obj_type in _LIST_ORDER]
         
         matching_objects = []
         
-        for obj_type, resource in object_types:
-            try:
-                # List objects of this type with pagination, filtered by class ID
-                print(f"DEBUG: Attempting to list {obj_type} objects for class {full_class_id}...")
-                objs = self._list_all_pages(resource.list, classId=full_class_id)
-                for obj in objs:
-                    matching_objects.append({
-                        'id': obj['id'],
-                        'resource': resource,
-                        'class_type': obj_type,
-                        'data': obj
-                    })
-                        
-            except HttpError as e:
+        # One batched round trip for all object types, filtered by class ID
+        logger.debug("Listing objects of all types for class %s in batch...", full_class_id)
+        results = self._list_all_pages_batched(
+            [(resource.list, {"classId": full_class_id}) for _, resource in object_types]
+        )
+
+        for (obj_type, resource), objs in zip(object_types, results):
+            if isinstance(objs, Exception):
                 # Skip if this object type has no resources or error
-                if e.resp.status != 404:
-                    print(f"Warning: Error listing {obj_type} objects: {e}")
-                continue
-            except Exception as e:
-                print(f"Error listing {obj_type} objects: {e}")
+                if not (isinstance(objs, HttpError) and objs.resp.status == 404):
+                    print(f"Warning: Error listing {obj_type} objects: {objs}")
                 continue
+            for obj in objs:
+                matching_objects.append({
+                    'id': obj['id'],
+                    'resource': resource,
+                    'class_type': obj_type,
+                    'data': obj
+                })
         
         return matching_objects
 
-    def verify_pass(self, object_id):
+    def verify_pass(self, object_id, class_id_hint=None, class_type=None):
         """
         Orchestrates the verification process:
         1. Fetches the User Object (Pass).
         2. Extracts the linked Class ID.
         3. Fetches the Class Template details.
+
+        If the class is known up front (`class_id_hint`, or the class seen the
+        last time this object was verified), it is fetched speculatively in
+        parallel with the object, saving a full round-trip when the object
+        still points at that class.
+
+        Args:
+            object_id: Object ID (with or without issuer prefix)
+            class_id_hint: Optional class ID the object is expected to link to
+            class_type: Optional expected type, tried first for both lookups
         """
+        class_future = None
         try:
-            print(f"Fetching object: {object_id}")
-            wallet_object = self.get_object(object_id)
+            if class_id_hint:
+                predicted_class_id = self._prepare_ids_to_try(class_id_hint)[0]
+            else:
+                predicted_class_id = self._object_class_ids.get(object_id)
+            if predicted_class_id:
+                class_future = self._executor.submit(self.get_class, predicted_class_id, class_type)
+
+            logger.debug("Fetching object: %s", object_id)
+            wallet_object = self.get_object(object_id, class_type=class_type)
             
             class_id = wallet_object.get('classId')
             if not class_id:
                 return {"error": "No classId found in the object."}
             
-            print(f"Found Class ID: {class_id}")
-            wallet_class = self.get_class(class_id)
+            logger.debug("Found Class ID: %s", class_id)
+            if class_future and class_id == predicted_class_id:
+                wallet_class = class_future.result()
+            else:
+                # An object's class is always of the same vertical as the object
+                object_type = self._type_hints["object"].get(wallet_object.get('id'))
+                wallet_class = self.get_class(class_id, class_type=object_type or class_type)
+            self._object_class_ids.set(object_id, class_id)
             
             return {
                 "object": wallet_object,
@@ -340,6 +1244,10 @@ class WalletClient:
             }
         except Exception as e:
             return {"error": str(e)}
+        finally:
+            # Drop a mispredicted class fetch that has not started yet
+            if class_future:
+                class_future.cancel()
     
     def create_pass_object(self, object_data, class_type="EventTicket"):
         """
@@ -354,18 +1262,12 @@ class WalletClient:
         """
         try:
             # Select appropriate resource based on class type
-            if class_type == "EventTicket":
-                resource = self.service.eventticketobject()
-            elif class_type == "LoyaltyCard":
-                resource = self.service.loyaltyobject()
-            elif class_type == "GiftCard":
-                resource = self.service.giftcardobject()
-            elif class_type == "TransitPass":
-                resource = self.service.transitobject()
-            else:
-                resource = self.service.genericobject()
+            resource = self._write_resource("object", class_type)
             
-            return resource.insert(body=object_data).execute()
+            created = _with_retries(resource.insert(body=object_data).execute, INSERT_RETRY_STATUSES)
+            if isinstance(object_data, dict) and object_data.get("id"):
+                self._missing_objects.pop(object_data["id"])
+            return created
         except HttpError as e:
             raise GoogleWalletAPIError(
                 f"Error creating pass object: {e}",
@@ -396,39 +1298,12 @@ class WalletClient:
             # will be silently dropped by Google. To avoid confusion and accidental wipes,
             # only patch GenericClass with the subset we actually expect to persist.
             if class_type == "Generic" and isinstance(class_data, dict):
-                allowed_generic_keys = {
-                    "id",
-                    "issuerName",
-                    "reviewStatus",
-                    "hexBackgroundColor",
-                    "logo",
-                    "heroImage",
-                    "header",
-                    "cardTitle",
-                    "barcode",
-                    "textModulesData",
-                    "linksModuleData",
-                    "imageModulesData",
-                    "classTemplateInfo",
-                    "messages",
-                    "multipleDevicesAndHoldersAllowedStatus",
-                    "viewUnlockRequirement",
-                    "callbackOptions",
-                    "securityAnimation",
-                    "enableSmartTap",
-                    "redemptionIssuers",
-                    "merchantLocations",
-                    "valueAddedModuleData",
-                    "appLinkData",
-                }
-                class_data = {k: v for k, v in class_data.items() if k in allowed_generic_keys}
+                class_data = {k: v for k, v in class_data.items() if k in _GENERIC_CLASS_KEYS}
 
             # Sanitize reviewStatus field to prevent invalid values
-            # Google Wallet only accepts: "UNDER_REVIEW", "DRAFT", or "APPROVED"
-            allowed_review_statuses = {"UNDER_REVIEW", "DRAFT", "APPROVED"}
             review_status = class_data.get("reviewStatus")
             
-            if isinstance(review_status, str) and review_status not in allowed_review_statuses:
+            if isinstance(review_status, str) and review_status not in _ALLOWED_REVIEW_STATUSES:
                 # Invalid value (e.g., "Optional[APPROVED]"), remove it and use safe default
                 print(f"Warning: Invalid reviewStatus '{review_status}' detected, using default 'UNDER_REVIEW'")
                 class_data["reviewStatus"] = "UNDER_REVIEW"
@@ -437,54 +1312,35 @@ class WalletClient:
                 class_data["reviewStatus"] = "UNDER_REVIEW"
             
             # Select appropriate resource based on class type
-            if class_type == "EventTicket":
-                resource = self.service.eventticketclass()
-            elif class_type == "LoyaltyCard":
-                resource = self.service.loyaltyclass()
-            elif class_type == "GiftCard":
-                resource = self.service.giftcardclass()
-            elif class_type == "TransitPass":
-                resource = self.service.transitclass()
-            else:
-                resource = self.service.genericclass()
+            resource = self._write_resource("class", class_type)
             
             # Try to insert the class
-            return resource.insert(body=class_data).execute()
+            return _with_retries(resource.insert(body=class_data).execute, INSERT_RETRY_STATUSES)
         except HttpError as e:
             # If class already exists, try to update it
             if e.resp.status == 409:  # Conflict - class already exists
                 try:
                     # Google Wallet does not allow patching reviewStatus. Remove it at any depth.
-                    import copy
-                    patch_body = copy.deepcopy(class_data)
-                    def remove_review_status(obj):
-                        if isinstance(obj, dict):
-                            obj.pop('reviewStatus', None)
-                            for value in obj.values():
-                                remove_review_status(value)
-                        elif isinstance(obj, list):
-                            for item in obj:
-                                remove_review_status(item)
-                    remove_review_status(patch_body)
+                    patch_body = without_review_status(class_data)
 
                     # Use update instead of patch for full replacement.
                     # patch() deep-merges nested arrays like detailsItemInfos,
                     # causing stale items to persist. update() replaces the
                     # entire resource so the template override is exact.
                     print(f"Class exists, attempting to update (full replace)...")
-                    return resource.update(
+                    return _with_retries(resource.update(
                         resourceId=class_data['id'],
                         body=patch_body
-                    ).execute()
+                    ).execute)
                 except HttpError as update_error:
                     # Print detailed error for debugging
-                    import json
+                    class_json = _json_pretty(class_data)
                     print(f"Error updating class. Class data being sent:")
-                    print(json.dumps(class_data, indent=2))
+                    print(class_json)
                     error_details = update_error.content.decode('utf-8') if hasattr(update_error, 'content') else str(update_error)
                     print(f"Error details: {error_details}")
                     raise GoogleWalletAPIError(
-                        f"Error updating existing class: {update_error}\n\nClass data: {json.dumps(class_data, indent=2)}",
+                        f"Error updating existing class: {update_error}\n\nClass data: {class_json}",
                         status_code=update_error.resp.status if hasattr(update_error, 'resp') else None,
                         detail=error_details,
                     ) from update_error
@@ -493,6 +1349,9 @@ class WalletClient:
                     f"Error creating pass class: {e}",
                     status_code=e.resp.status if hasattr(e, 'resp') else None,
                 ) from e
+        finally:
+            if isinstance(class_data, dict) and class_data.get("id"):
+                self._forget_class(class_data["id"])
     
     
     def generate_save_link(self, object_id, class_type="EventTicket", class_id=None, object_payload=None):
@@ -509,15 +1368,7 @@ class WalletClient:
             URL that can be used to add pass to Google Wallet
         """
         # Determine the payload key based on class type
-        payload_key_map = {
-            "EventTicket": "eventTicketObjects",
-            "LoyaltyCard": "loyaltyObjects",
-            "GiftCard": "giftCardObjects",
-            "TransitPass": "transitObjects",
-            "Generic": "genericObjects"
-        }
-        
-        payload_key = payload_key_map.get(class_type, "genericObjects")
+        payload_key = _SAVE_PAYLOAD_KEYS.get(class_type, "genericObjects")
         
         # Ensure proper prefix (Issuer ID must be present for the link to work)
         object_id = self._prepare_ids_to_try(object_id)[0]
@@ -527,11 +1378,17 @@ class WalletClient:
             obj_payload["id"] = object_id
             if class_id:
                 obj_payload["classId"] = self._prepare_ids_to_try(class_id)[0]
+            cache_key = None
         else:
             obj_payload = {"id": object_id}
             if class_id:
                 class_id = self._prepare_ids_to_try(class_id)[0]
                 obj_payload["classId"] = class_id
+            # ID-only links are identical per pass, so reuse a recently signed one
+            cache_key = (payload_key, object_id, class_id)
+            cached_link = self._save_links.get(cache_key)
+            if cached_link:
+                return cached_link
 
         # Create JWT claims
         claims = {
@@ -539,31 +1396,20 @@ class WalletClient:
             "aud": "google",
             "origins": [],
             "typ": "savetowallet",
-            "iat": int(datetime.utcnow().timestamp()),
+            "iat": int(time.time()),
             "payload": {
                 payload_key: [obj_payload]
             }
         }
         
-        # Read the private key from the service account file
-        import json
-        with open(configs.KEY_FILE_PATH, 'r') as f:
-            service_account_info = json.load(f)
-            private_key = service_account_info['private_key']
-        
         # Sign the JWT with the service account private key
-        token = jwt.encode(
-            claims,
-            private_key,
-            algorithm='RS256'
-        )
-        
-        # Ensure token is string (PyJWT < 2.0 returns bytes)
-        if isinstance(token, bytes):
-            token = token.decode('utf-8')
+        token = _encode_jwt(claims)
             
         # Return the Save to Wallet URL
-        return f"https://pay.google.com/gp/v/save/{token}"
+        save_link = f"https://pay.google.com/gp/v/save/{token}"
+        if cache_key:
+            self._save_links.set(cache_key, save_link)
+        return save_link
     
     def update_pass_class(self, class_id, class_data, class_type="Generic"):
         """
@@ -584,49 +1430,26 @@ class WalletClient:
             full_class_id = self._prepare_ids_to_try(class_id)[0]
             
             # Select appropriate resource based on class type
-            if class_type == "EventTicket":
-                resource = self.service.eventticketclass()
-            elif class_type == "LoyaltyCard":
-                resource = self.service.loyaltyclass()
-            elif class_type == "GiftCard":
-                resource = self.service.giftcardclass()
-            elif class_type == "TransitPass":
-                resource = self.service.transitclass()
-            else:
-                resource = self.service.genericclass()
+            resource = self._write_resource("class", class_type)
 
             # 1. Fetch CURRENT state from Google
             try:
-                current_data = resource.get(resourceId=full_class_id).execute()
+                current_data = _with_retries(resource.get(resourceId=full_class_id).execute)
             except Exception as e:
                 print(f"Warning: Could not fetch current class {full_class_id} before update: {e}")
                 current_data = {}
 
             # 2. Merge data and clean reviewStatus (Google Wallet doesn't allow updating it)
-            import copy
-            final_body = copy.deepcopy(current_data)
-            final_body.update(class_data)
-            
             # Note: classTemplateInfo is already included in class_data (from json_templates.py
             # via _build_class_json). We do NOT regenerate it here — json_templates.py is the
             # single source of truth for the front/back face layout.
-            
-            def remove_review_status(obj):
-                if isinstance(obj, dict):
-                    obj.pop('reviewStatus', None)
-                    for value in obj.values():
-                        remove_review_status(value)
-                elif isinstance(obj, list):
-                    for item in obj:
-                        remove_review_status(item)
-            
-            remove_review_status(final_body)
+            final_body = without_review_status({**current_data, **class_data})
             
             # 3. Use patch for partial updates
-            return resource.patch(
+            return _with_retries(resource.patch(
                 resourceId=full_class_id,
                 body=final_body
-            ).execute()
+            ).execute)
             
         except HttpError as e:
             error_details = e.content.decode('utf-8') if hasattr(e, 'content') else str(e)
@@ -635,6 +1458,8 @@ class WalletClient:
                 status_code=e.resp.status if hasattr(e, 'resp') else None,
                 detail=error_details,
             ) from e
+        finally:
+            self._forget_class(class_id)
     
     def _build_notification_message(self, header="Pass Updated", body="Your pass has been updated."):
         """Build a unique notification message that triggers a push notification.
@@ -644,22 +1469,21 @@ class WalletClient:
         - `messageType: TEXT_AND_NOTIFY`
         - A `displayInterval` with start/end timestamps
         """
-        import time as _time
-        from datetime import datetime, timedelta
-        
-        now = datetime.utcnow()
-        return {
-            "id": f"update_notif_{int(_time.time())}",
-            "header": header,
-            "body": body,
-            "kind": "walletobjects#walletObjectMessage",
-            "messageType": "TEXT_AND_NOTIFY",
-            "displayInterval": {
-                "start": {"date": (now - timedelta(minutes=1)).isoformat() + "Z"},
-                "end": {"date": (now + timedelta(hours=1)).isoformat() + "Z"}
-            }
-        }
+        now_ts = int(time.time())
+        return _notification_message(header, body, f"update_notif_{now_ts}", now_ts)
     
+    def _append_message(self, resource, full_object_id, new_message):
+        """
+        Append `new_message` to an object's messages in one minimal patch.
+
+        Reads back only `messages` and asks for only `id` in the patch
+        response (partial responses), so a notification moves a few hundred
+        bytes each way instead of the whole pass twice.
+        """
+        current_data = _with_retries(resource.get(resourceId=full_object_id, fields="messages").execute)
+        patch_body = _message_patch_body(current_data.get("messages", []), new_message)
+        return _with_retries(resource.patch(resourceId=full_object_id, body=patch_body, fields="id").execute)
+
     def send_push_notification(self, full_object_id, resource, message_header="📱 Pass Updated", message_body="Your pass information has been updated."):
         """
         Trigger a push notification using the EXACT same approach as debug_notification.py.
@@ -670,42 +1494,13 @@ class WalletClient:
         3. Change groupingId to force Android to re-evaluate
         4. Send ONE minimal patch
         """
-        import time as _time
-        import uuid
-        from datetime import datetime, timedelta
-        
         try:
-            # 1. Get current state from Google
-            current_data = resource.get(resourceId=full_object_id).execute()
-            
-            # 2. Build unique notification message
-            now = datetime.utcnow()
-            message_id = f"update_notif_{int(_time.time())}"
-            new_message = {
-                "header": message_header,
-                "body": message_body,
-                "kind": "walletobjects#walletObjectMessage",
-                "id": message_id,
-                "messageType": "TEXT_AND_NOTIFY",
-                "displayInterval": {
-                    "start": {"date": (now - timedelta(minutes=1)).isoformat() + "Z"},
-                    "end": {"date": (now + timedelta(hours=1)).isoformat() + "Z"}
-                }
-            }
-            
-            # 3. APPEND to existing messages (key difference from our old approach!)
-            existing_messages = current_data.get("messages", [])
-            existing_messages.append(new_message)
+            # 1. Build unique notification message
+            now_ts = int(time.time())
+            new_message = _notification_message(message_header, message_body, f"update_notif_{now_ts}", now_ts)
             
-            # 4. Build minimal patch body (exactly like debug_notification.py)
-            patch_body = {
-                "state": "ACTIVE",
-                "groupingId": f"group_{int(_time.time())}",
-                "messages": existing_messages
-            }
-            
-            # 5. Send single minimal patch
-            resource.patch(resourceId=full_object_id, body=patch_body).execute()
+            # 2. APPEND to existing messages and send ONE minimal patch
+            self._append_message(resource, full_object_id, new_message)
             print(f"NOTIFICATION: Push notification sent for {full_object_id}")
             
         except Exception as e:
@@ -726,53 +1521,18 @@ class WalletClient:
             message_header: Notification header text
             message_body: Notification body text
         """
-        import time as _time
-        from datetime import datetime, timedelta
-        
         full_object_id = self._prepare_ids_to_try(object_id)[0]
         
         # Resolve the correct Google Wallet resource
-        if class_type == "EventTicket":
-            resource = self.service.eventticketobject()
-        elif class_type == "LoyaltyCard":
-            resource = self.service.loyaltyobject()
-        elif class_type == "GiftCard":
-            resource = self.service.giftcardobject()
-        elif class_type == "TransitPass":
-            resource = self.service.transitobject()
-        else:
-            resource = self.service.genericobject()
+        resource = self._write_resource("object", class_type)
         
         try:
-            # 1. Fetch current pass to get existing messages
-            current_data = resource.get(resourceId=full_object_id).execute()
-            
-            # 2. Build the notification message
-            now = datetime.utcnow()
-            new_message = {
-                "header": message_header,
-                "body": message_body,
-                "kind": "walletobjects#walletObjectMessage",
-                "id": f"notif_{int(_time.time())}",
-                "messageType": "TEXT_AND_NOTIFY",
-                "displayInterval": {
-                    "start": {"date": (now - timedelta(minutes=1)).isoformat() + "Z"},
-                    "end": {"date": (now + timedelta(hours=1)).isoformat() + "Z"}
-                }
-            }
-            
-            # 3. Append to existing messages
-            existing_messages = current_data.get("messages", [])
-            existing_messages.append(new_message)
-            
-            # 4. Build robust patch body (including state and groupingId to force immediate sync)
-            patch_body = {
-                "state": "ACTIVE",
-                "groupingId": f"group_{int(_time.time())}",
-                "messages": existing_messages
-            }
+            # 1. Build the notification message
+            now_ts = int(time.time())
+            new_message = _notification_message(message_header, message_body, f"notif_{now_ts}", now_ts)
             
-            resource.patch(resourceId=full_object_id, body=patch_body).execute()
+            # 2. Append to existing messages (state and groupingId force immediate sync)
+            self._append_message(resource, full_object_id, new_message)
             print(f"NOTIFICATION: Custom notification sent for {full_object_id}")
             
         except Exception as e:
@@ -781,82 +1541,60 @@ class WalletClient:
     def update_pass_object(self, object_id, class_id, holder_name, holder_email, pass_data, class_type="EventTicket", status=None, notification_message=None, send_notification=True):
         """
         Update an individual pass object in Google Wallet using an ATOMIC patch.
-        """
-        import time as _time
-        from datetime import datetime, timedelta
-        import logging
-        log = logging.getLogger(__name__)
 
+        When the new data carries no card title, the class (whose issuer name
+        is the notification header fallback) is fetched in parallel with the
+        object's current state instead of after it.
+        """
+        class_future = None
         try:
             # Ensure IDs have issuer prefix
             full_object_id = self._prepare_ids_to_try(object_id)[0]
             full_class_id = self._prepare_ids_to_try(class_id)[0]
 
-            # 1. Select appropriate resource
-            if class_type == "EventTicket":
-                resource = self.service.eventticketobject()
-            elif class_type == "LoyaltyCard":
-                resource = self.service.loyaltyobject()
-            elif class_type == "GiftCard":
-                resource = self.service.giftcardobject()
-            elif class_type == "TransitPass":
-                resource = self.service.transitobject()
-            else:
-                resource = self.service.genericobject()
+            # 1. Select appropriate builder, resource and patch URL
+            build_object, resource, patch_url = self._object_writers[_write_pass_type(class_type)]
+
+            # 2. Build the NEW pass data using appropriate builder
+            # Use keyword arguments to avoid positional mismatch (e.g. status vs color)
+            object_data = build_object(
+                full_object_id, full_class_id, holder_name, holder_email, pass_data,
+                status=status, include_messages=False
+            )
+            new_card_title = (
+                _localized_value(object_data, "cardTitle") or
+                pass_data.get("card_title") or
+                pass_data.get("header_value")
+            )
+            if not new_card_title:
+                class_future = self._executor.submit(self.get_class, full_class_id, class_type)
 
-            # 2. Fetch CURRENT state from Google
+            # 3. Fetch CURRENT state from Google (only the fields read below)
             try:
-                current_data = resource.get(resourceId=full_object_id).execute()
+                current_data = _with_retries(resource.get(resourceId=full_object_id, fields=UPDATE_READ_FIELDS).execute)
                 existing_messages = current_data.get("messages", [])
             except Exception as e:
                 print(f"Warning: Could not fetch current object {full_object_id} before update: {e}")
                 existing_messages = []
 
-            # 3. Build the NEW pass data using appropriate builder
-            # Use keyword arguments to avoid positional mismatch (e.g. status vs color)
-            if class_type == "EventTicket":
-                object_data = self.build_event_ticket_object(
-                    full_object_id, full_class_id, holder_name, holder_email, pass_data, 
-                    status=status, message_type=None
-                )
-            elif class_type == "LoyaltyCard":
-                object_data = self.build_loyalty_object(
-                    full_object_id, full_class_id, holder_name, holder_email, pass_data, 
-                    status=status, message_type=None
-                )
-            else:  # Generic, GiftCard, Transit
-                object_data = self.build_generic_object(
-                    full_object_id, full_class_id, holder_name, holder_email, pass_data, 
-                    status=status, message_type=None
-                )
-
             # Resolve Header for the notification
             display_header = "Update"
             try:
-                # 1. Try to get cardTitle from EXISTING data at Google (priority for Generic)
-                existing_card_title = (
-                    current_data.get("cardTitle", {}).get("defaultValue", {}).get("value")
-                )
-                
-                # 2. Try to get card_title from the NEW object data or pass_data
-                new_card_title = (
-                    object_data.get("cardTitle", {}).get("defaultValue", {}).get("value") or
-                    pass_data.get("card_title") or
-                    pass_data.get("header_value")
-                )
-                
+                # 1. Try to get cardTitle from EXISTING data at Google (priority for Generic),
+                #    then card_title from the NEW object data or pass_data
+                existing_card_title = _localized_value(current_data, "cardTitle")
                 display_header = existing_card_title or new_card_title
                 
-                # 3. Fallback to Class Issuer Name if Card Title is missing
+                # 2. Fallback to Class Issuer Name if Card Title is missing
                 if not display_header:
-                    wallet_class = self.get_class(full_class_id)
+                    wallet_class = class_future.result()
                     display_header = (
                         wallet_class.get("issuerName") or 
-                        wallet_class.get("localizedIssuerName", {}).get("defaultValue", {}).get("value") or
+                        _localized_value(wallet_class, "localizedIssuerName") or
                         "Update"
                     )
                 
-                # 4. Branding check: If it's a long "Mertesacker" name, shorten to "MFO" if appropriate
+                # 3. Branding check: If it's a long "Mertesacker" name, shorten to "MFO" if appropriate
                 if isinstance(display_header, str) and "Mertesacker" in display_header:
                     display_header = "MFO"
                     
@@ -893,7 +1631,7 @@ class WalletClient:
                         if not text_modules and current_data.get("textModulesData"):
                             text_modules = current_data.get("textModulesData", [])
                             object_data["textModulesData"] = text_modules
-                            log.info(f"  ↳ Preserved {len(text_modules)} modules from Google state (local was empty)")
+                            logger.info(f"  ↳ Preserved {len(text_modules)} modules from Google state (local was empty)")
 
                         # TARGETED UPDATE: User wants Row 2 Left (ID: row_1_left)
                         target_id = "row_1_left"
@@ -901,11 +1639,11 @@ class WalletClient:
                         
                         if target_mod:
                             target_mod["body"] = full_display_message
-                            log.info(f"  ↳ Updated target module '{target_id}' with notification message")
+                            logger.info(f"  ↳ Updated target module '{target_id}' with notification message")
                         elif len(text_modules) >= 2:
                             # Fallback to index 1 if specific ID not found
                             text_modules[1]["body"] = full_display_message
-                            log.info(f"  ↳ Updated module at index 1 (fallback) with notification message")
+                            logger.info(f"  ↳ Updated module at index 1 (fallback) with notification message")
                         else:
                             # Append if not enough modules
                             text_modules.append({
@@ -913,7 +1651,7 @@ class WalletClient:
                                 "body": full_display_message,
                                 "id": "status_update"
                             })
-                            log.info(f"  ↳ Appended new status module (no target/fallback found)")
+                            logger.info(f"  ↳ Appended new status module (no target/fallback found)")
                         
                         # C. Add DEDICATED notification module for the back of the pass
                         # Ensure we don't duplicate it if it already exists
@@ -927,7 +1665,7 @@ class WalletClient:
                     print(f"Warning: Failed to update pass front fields: {e}")
             # end if send_notification
 
-            now = datetime.utcnow().replace(microsecond=0)
+            now_ts = int(time.time())
             # Use UUID for message and grouping ID to ensure Google treats it as a fresh event
             msg_id = f"notif_{uuid.uuid4().hex[:12]}"
             # If user explicitly provided messages, use their messageType for the push message too.
@@ -938,17 +1676,10 @@ class WalletClient:
                 if isinstance(last_type, str) and last_type.strip():
                     push_message_type = last_type.strip()
             
-            new_msg = {
-                "header": display_header,
-                "body": msg_body,
-                "kind": "walletobjects#walletObjectMessage",
-                "id": msg_id,
-                "messageType": push_message_type,
-                "displayInterval": {
-                    "start": {"date": (now - timedelta(minutes=1)).isoformat() + "Z"},
-                    "end": {"date": (now + timedelta(hours=24)).isoformat() + "Z"}
-                }
-            }
+            new_msg = _notification_message(
+                display_header, msg_body, msg_id, now_ts,
+                duration=24 * 3600, message_type=push_message_type
+            )
             
             # region [NOTIFICATIONS LOGIC]
             if send_notification:
@@ -957,7 +1688,7 @@ class WalletClient:
                 # displayInterval.end of all previous messages to the past so they hide immediately.
                 for old_msg in existing_messages:
                     if "displayInterval" in old_msg and "end" in old_msg["displayInterval"]:
-                        old_msg["displayInterval"]["end"]["date"] = (now - timedelta(minutes=1)).isoformat() + "Z"
+                        old_msg["displayInterval"]["end"]["date"] = _utc_iso(now_ts - 60)
 
                 existing_messages.append(new_msg)
                 
@@ -967,22 +1698,18 @@ class WalletClient:
                 # ANDROID UI TRICK: Force immediate refresh by changing groupingId
                 object_data["groupingId"] = f"grp_{uuid.uuid4().hex[:12]}"
             else:
-                # In silent mode, we remove any messages that would trigger a notification
+                # In silent mode, no messages are sent (the builder left them out)
                 # BUT we still rotate groupingId to force a device refresh so the user sees the edits!
-                object_data.pop("messages", None)
                 object_data["groupingId"] = f"grp_{uuid.uuid4().hex[:12]}"
             # endregion
 
 
             # 5. EXECUTE SINGLE PATCH (Atomic operation)
-            log.info(f"DEBUG: Patching object {full_object_id} with barcode: {object_data.get('barcode')}")
-            print(f"DEBUG NOTIFICATION: Sending patch for {full_object_id} with msg_id {msg_id}")
-            result = resource.patch(
-                resourceId=full_object_id,
-                body=object_data
-            ).execute()
+            logger.debug("Patching object %s with barcode: %s", full_object_id, object_data.get('barcode'))
+            logger.debug("Sending patch for %s with msg_id %s", full_object_id, msg_id)
+            result = _with_retries(lambda: self._patch_by_url(patch_url, full_object_id, object_data))
             
-            print(f"SUCCESS: Atomic update/notification complete for {full_object_id}")
+            logger.debug("Atomic update/notification complete for %s", full_object_id)
             return result
             
         except HttpError as e:
@@ -992,8 +1719,39 @@ class WalletClient:
                 status_code=e.resp.status if hasattr(e, 'resp') else None,
                 detail=error_details,
             ) from e
+        finally:
+            # Drop a class prefetch the existing card title made unnecessary
+            if class_future:
+                class_future.cancel()
+
+    def update_pass_objects(self, updates):
+        """
+        Run update_pass_object for many passes concurrently.
+
+        Each update is still its own read + patch; up to UPDATE_MAX_WORKERS
+        of them are in flight at once, so a bulk refresh takes roughly
+        len(updates) / UPDATE_MAX_WORKERS round trips instead of len(updates).
+
+        Args:
+            updates: List of keyword-argument dicts for update_pass_object
+
+        Returns:
+            List aligned with `updates`: the patched object, or the exception
+            update_pass_object raised for that pass.
+        """
+        if not updates:
+            return []
+
+        def _update(kwargs):
+            try:
+                return self.update_pass_object(**kwargs)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=min(UPDATE_MAX_WORKERS, len(updates))) as pool:
+            return list(pool.map(_update, updates))
     
-    def build_event_ticket_object(self, object_id, class_id, holder_name, holder_email, pass_data, custom_color=None, message_type="TEXT_AND_NOTIFY", status=None):
+    def build_event_ticket_object(self, object_id, class_id, holder_name, holder_email, pass_data, custom_color=None, message_type="TEXT_AND_NOTIFY", status=None, include_messages=True):
         """
         Build an EventTicket object structure for Google Wallet
         
@@ -1005,6 +1763,8 @@ class WalletClient:
             pass_data: Dictionary with pass-specific data (seat, gate, etc.)
             custom_color: Optional hex color to override class color (e.g., "#FF5722")
             message_type: Message type for notifications (TEXT or TEXT_AND_NOTIFY)
+            include_messages: False leaves "messages" out entirely (callers that
+                set messages themselves, e.g. update_pass_object)
             
         Returns:
             Dictionary formatted for Google Wallet API
@@ -1015,150 +1775,66 @@ class WalletClient:
         custom_conf_code = pd.get("confirmationCode") or pd.get("confirmation_code") or (object_id.split('.')[-1] if '.' in object_id else object_id)
 
         # Map local status to Google Wallet state
-        gw_state = "ACTIVE"
-        if status:
-            s_upper = status.upper()
-            if s_upper in ["ACTIVE", "COMPLETED", "EXPIRED", "INACTIVE"]:
-                gw_state = s_upper
+        gw_state = _object_state(status)
 
         obj = {
             "id": object_id,
             "classId": class_id,
             "state": gw_state,
-            "ticketHolderName": {"defaultValue": {"language": "en-US", "value": custom_ticket_holder}},
+            "ticketHolderName": _en_us(custom_ticket_holder),
             "reservationInfo": {
                 "confirmationCode": custom_conf_code
             }
         }
 
         # Add Branding (Color/CardTitle/Header)
-        branding_bg = custom_color or pd.get("hexBackgroundColor") or pd.get("background_color") or pd.get("base_color")
-        if isinstance(branding_bg, str) and branding_bg.strip():
-            branding_bg = branding_bg.strip()
-            if not branding_bg.startswith("#") and len(branding_bg) in [3, 6]:
-                branding_bg = f"#{branding_bg}"
-        else:
-            branding_bg = None
+        branding_bg = _hex_color(custom_color or pd.get("hexBackgroundColor") or pd.get("background_color") or pd.get("base_color"))
 
         if branding_bg:
             obj["hexBackgroundColor"] = branding_bg
             
         card_title = pd.get("card_title") or pd.get("cardTitle") or pd.get("issuer_name")
         if card_title:
-            obj["cardTitle"] = {"defaultValue": {"language": "en-US", "value": str(card_title)}}
+            obj["cardTitle"] = _en_us(str(card_title))
             
         header_val = pd.get("header_value") or pd.get("header")
         if header_val:
-            obj["header"] = {"defaultValue": {"language": "en-US", "value": str(header_val)}}
+            obj["header"] = _en_us(str(header_val))
             
         subheader_val = pd.get("subheader_value") or pd.get("subheader")
         if subheader_val:
-            obj["subheader"] = {"defaultValue": {"language": "en-US", "value": str(subheader_val)}}
+            obj["subheader"] = _en_us(str(subheader_val))
 
         # Add Branding (Logo/Hero) if in pass_data
         branding_logo_url = pd.get("logo_url") or pd.get("logoUrl")
         branding_hero_url = pd.get("hero_image_url") or pd.get("heroImageUrl") or pd.get("hero_url")
         if branding_logo_url:
-            obj["logo"] = {
-                "sourceUri": {"uri": str(branding_logo_url)},
-                "contentDescription": {"defaultValue": {"language": "en-US", "value": "Logo"}}
-            }
+            obj["logo"] = _image(str(branding_logo_url), "Logo")
         if branding_hero_url:
-            obj["heroImage"] = {
-                "sourceUri": {"uri": str(branding_hero_url)},
-                "contentDescription": {"defaultValue": {"language": "en-US", "value": "Hero Image"}}
-            }
+            obj["heroImage"] = _image(str(branding_hero_url), "Hero Image")
         
         # Add message with specified messageType
-        if message_type:
-            obj["messages"] = [{
-                "header": "Welcome",
-                "body": "Your pass has been created",
-                "messageType": message_type
-            }]
+        if include_messages and message_type:
+            obj["messages"] = [dict(_WELCOME_MESSAGE, messageType=message_type)]
         
         # Add seat information if available
         if pass_data:
-            seat_value = pass_data.get("seatNumber") or pass_data.get("seat_number") or pass_data.get("seat", "")
-            if seat_value:
-                obj["seatInfo"] = {
-                    "seat": {
-                        "kind": "walletobjects#localizedString",
-                        "defaultValue": {
-                            "kind": "walletobjects#translatedString",
-                            "language": "en-US",
-                            "value": str(seat_value)
-                        }
-                    }
-                }
-            if "gate" in pass_data:
-                obj["seatInfo"] = obj.get("seatInfo", {})
-                obj["seatInfo"]["gate"] = {
-                    "kind": "walletobjects#localizedString",
-                    "defaultValue": {
-                        "kind": "walletobjects#translatedString",
-                        "language": "en-US",
-                        "value": str(pass_data["gate"])
-                    }
-                }
-            if "row" in pass_data:
-                obj["seatInfo"] = obj.get("seatInfo", {})
-                obj["seatInfo"]["row"] = {
-                    "kind": "walletobjects#localizedString",
-                    "defaultValue": {
-                        "kind": "walletobjects#translatedString",
-                        "language": "en-US",
-                        "value": str(pass_data["row"])
-                    }
-                }
-            if "section" in pass_data:
-                obj["seatInfo"] = obj.get("seatInfo", {})
-                obj["seatInfo"]["section"] = {
-                    "kind": "walletobjects#localizedString",
-                    "defaultValue": {
-                        "kind": "walletobjects#translatedString",
-                        "language": "en-US",
-                        "value": str(pass_data["section"])
-                    }
-                }
+            seat_info = {}
+            seat_key = next((key for key in _SEAT_KEYS if pass_data.get(key)), None)
+            if seat_key:
+                seat_info["seat"] = _localized_string(pass_data[seat_key])
+            seat_info.update({
+                key: _localized_string(pass_data[key]) for key in ("gate", "row", "section") if key in pass_data
+            })
+            if seat_info:
+                obj["seatInfo"] = seat_info
             
             # Note: event_name and event_date come from the class definition, not the object
             # These should not be added here to avoid duplication
             
             # Add info modules for all other pass data
-            info_label_values = []
-            
-            # Define which fields to show and their labels
-            field_labels = {
-                "event_time": "Event Time",
-                "seat_number": "Seat",
-                "seat": "Seat",
-                "section": "Section",
-                "row": "Row",
-                "gate": "Gate",
-                "venue": "Venue"
-            }
-            
-            for field_key, field_label in field_labels.items():
-                if field_key in pass_data and pass_data[field_key]:
-                    # Skip if already in seatInfo or textModules
-                    if field_key in ["event_name", "event_date"]:
-                        continue
-                    
-                    info_label_values.append({
-                        "label": field_label,
-                        "value": str(pass_data[field_key])
-                    })
-            
-            # Add any additional custom fields not in predefined list
-            for key, value in pass_data.items():
-                if value and key not in field_labels and key not in ["event_name", "event_date"]:
-                    # Format key as label
-                    label = key.replace("_", " ").title()
-                    info_label_values.append({
-                        "label": label,
-                        "value": str(value)
-                    })
+            skip_fields = _EVENT_SKIP_FIELDS_BY_SEAT_KEY.get(seat_key, _EVENT_SKIP_FIELDS)
+            info_label_values = _info_label_values(pass_data, _EVENT_FIELD_LABELS, skip_fields)
             
             # Add text/link modules if provided
             raw_modules = pass_data.get("textModulesData") or pass_data.get("text_modules", [])
@@ -1167,15 +1843,17 @@ class WalletClient:
             for m in raw_modules:
                 m_type = m.get("module_type", m.get("type", "text"))
                 m_body = str(m.get("body", "")).strip()
+                m_header = m.get("header", "")
+                m_id = m.get("id")
                 if m_type == "link":
                     uri = m_body if m_body.startswith(("http://", "https://")) else f"https://{m_body}"
                     link_mod = {"uri": uri}
-                    if m.get("header"): link_mod["description"] = m.get("header")
-                    if m.get("id"): link_mod["id"] = m.get("id")
+                    if m_header: link_mod["description"] = m_header
+                    if m_id: link_mod["id"] = m_id
                     link_mods.append(link_mod)
                 else:
-                    text_mod = {"header": m.get("header", ""), "body": m_body}
-                    if m.get("id"): text_mod["id"] = m.get("id")
+                    text_mod = {"header": m_header, "body": m_body}
+                    if m_id: text_mod["id"] = m_id
                     text_mods.append(text_mod)
 
             if text_mods:
@@ -1192,32 +1870,15 @@ class WalletClient:
                 }]
         
             # Barcode support (minimal: type + value)
-            barcode_obj = None
-            if isinstance(pd.get("barcode"), dict):
-                barcode_obj = pd.get("barcode")
-            else:
-                bc_type = pd.get("barcode_type") or pd.get("barcodeType")
-                bc_value = pd.get("barcode_value") or pd.get("barcodeValue")
-                if (isinstance(bc_type, str) and bc_type.strip()) or (isinstance(bc_value, str) and bc_value.strip()):
-                    barcode_obj = {
-                        "type": bc_type if bc_type else "QR_CODE",
-                        "value": bc_value if bc_value else "",
-                    }
-                    bc_alt = pd.get("barcode_alt_text") or pd.get("barcodeAltText")
-                    if bc_alt:
-                        barcode_obj["alternateText"] = str(bc_alt)
-            if isinstance(barcode_obj, dict) and isinstance(barcode_obj.get("value"), str) and barcode_obj["value"].strip():
+            barcode_obj = _barcode(pd)
+            if barcode_obj:
                 obj["barcode"] = barcode_obj
         
         return obj
     
-    def build_loyalty_object(self, object_id, class_id, holder_name, holder_email, pass_data, custom_color=None, message_type="TEXT_AND_NOTIFY", status=None):
+    def build_loyalty_object(self, object_id, class_id, holder_name, holder_email, pass_data, custom_color=None, message_type="TEXT_AND_NOTIFY", status=None, include_messages=True):
         # Map local status to Google Wallet state
-        gw_state = "ACTIVE"
-        if status:
-            s_upper = status.upper()
-            if s_upper in ["ACTIVE", "COMPLETED", "EXPIRED", "INACTIVE"]:
-                gw_state = s_upper
+        gw_state = _object_state(status)
                 
         obj = {
             "id": object_id,
@@ -1228,24 +1889,14 @@ class WalletClient:
         }
         
         pd = pass_data or {}
-        branding_bg = custom_color or pd.get("hexBackgroundColor") or pd.get("background_color") or pd.get("base_color")
-        if isinstance(branding_bg, str) and branding_bg.strip():
-            branding_bg = branding_bg.strip()
-            if not branding_bg.startswith("#") and len(branding_bg) in [3, 6]:
-                branding_bg = f"#{branding_bg}"
-        else:
-            branding_bg = None
+        branding_bg = _hex_color(custom_color or pd.get("hexBackgroundColor") or pd.get("background_color") or pd.get("base_color"))
 
         if branding_bg:
             obj["hexBackgroundColor"] = branding_bg
         
         # Add message with specified messageType
-        if message_type:
-            obj["messages"] = [{
-                "header": "Welcome",
-                "body": "Your loyalty card has been created",
-                "messageType": message_type
-            }]
+        if include_messages and message_type:
+            obj["messages"] = [dict(_LOYALTY_WELCOME_MESSAGE, messageType=message_type)]
         
         if pass_data:
             # Add loyalty points if available
@@ -1259,10 +1910,11 @@ class WalletClient:
             
             # Add text modules for member information
             text_modules = []
-            if "member_since" in pass_data and pass_data["member_since"]:
+            member_since = pass_data.get("member_since")
+            if member_since:
                 text_modules.append({
                     "header": "Member Since",
-                    "body": str(pass_data["member_since"]),
+                    "body": str(member_since),
                     "id": "member_info"
                 })
             
@@ -1272,15 +1924,17 @@ class WalletClient:
             for m in (text_modules + (pass_data.get("textModulesData") or pass_data.get("text_modules", []))):
                 m_type = m.get("module_type", m.get("type", "text"))
                 m_body = str(m.get("body", "")).strip()
+                m_header = m.get("header", "")
+                m_id = m.get("id")
                 if m_type == "link":
                     uri = m_body if m_body.startswith(("http://", "https://")) else f"https://{m_body}"
                     link_mod = {"uri": uri}
-                    if m.get("header"): link_mod["description"] = m.get("header")
-                    if m.get("id"): link_mod["id"] = m.get("id")
+                    if m_header: link_mod["description"] = m_header
+                    if m_id: link_mod["id"] = m_id
                     link_mods.append(link_mod)
                 else:
-                    text_mod = {"header": m.get("header", ""), "body": m_body}
-                    if m.get("id"): text_mod["id"] = m.get("id")
+                    text_mod = {"header": m_header, "body": m_body}
+                    if m_id: text_mod["id"] = m_id
                     text_mods.append(text_mod)
 
             if text_mods:
@@ -1289,37 +1943,7 @@ class WalletClient:
                 obj["linksModuleData"] = {"uris": link_mods}
             
             # Add info modules for tier and other details
-            info_label_values = []
-            
-            # Define which fields to show and their labels
-            field_labels = {
-                "tier_level": "Tier",
-                "tier": "Tier",
-                "points_balance": "Points Balance",
-                "points": "Points",
-                "rewards_available": "Available Rewards",
-                "expiry_date": "Expires"
-            }
-            
-            for field_key, field_label in field_labels.items():
-                if field_key in pass_data and pass_data[field_key]:
-                    # Skip member_since as it's in textModules
-                    if field_key == "member_since":
-                        continue
-                    
-                    info_label_values.append({
-                        "label": field_label,
-                        "value": str(pass_data[field_key])
-                    })
-            
-            # Add any additional custom fields
-            for key, value in pass_data.items():
-                if value and key not in field_labels and key != "member_since":
-                    label = key.replace("_", " ").title()
-                    info_label_values.append({
-                        "label": label,
-                        "value": str(value)
-                    })
+            info_label_values = _info_label_values(pass_data, _LOYALTY_FIELD_LABELS, _LOYALTY_SKIP_FIELDS)
             
             if info_label_values:
                 obj["infoModulesData"] = [{
@@ -1330,26 +1954,13 @@ class WalletClient:
                 }]
             
             # Barcode support (minimal: type + value)
-            barcode_obj = None
-            if isinstance(pd.get("barcode"), dict):
-                barcode_obj = pd.get("barcode")
-            else:
-                bc_type = pd.get("barcode_type") or pd.get("barcodeType")
-                bc_value = pd.get("barcode_value") or pd.get("barcodeValue")
-                if (isinstance(bc_type, str) and bc_type.strip()) or (isinstance(bc_value, str) and bc_value.strip()):
-                    barcode_obj = {
-                        "type": bc_type if bc_type else "QR_CODE",
-                        "value": bc_value if bc_value else "",
-                    }
-                    bc_alt = pd.get("barcode_alt_text") or pd.get("barcodeAltText")
-                    if bc_alt:
-                        barcode_obj["alternateText"] = str(bc_alt)
-            if isinstance(barcode_obj, dict) and isinstance(barcode_obj.get("value"), str) and barcode_obj["value"].strip():
+            barcode_obj = _barcode(pd)
+            if barcode_obj:
                 obj["barcode"] = barcode_obj
         
         return obj
     
-    def build_generic_object(self, object_id, class_id, holder_name, holder_email, pass_data, custom_color=None, message_type="TEXT_AND_NOTIFY", status=None):
+    def build_generic_object(self, object_id, class_id, holder_name, holder_email, pass_data, custom_color=None, message_type="TEXT_AND_NOTIFY", status=None, include_messages=True):
         # Extract explicit generic fields sent by UI
         pd = pass_data or {}
         card_title = pd.get("card_title")
@@ -1359,20 +1970,10 @@ class WalletClient:
         # Generic *object*-level branding (Google ignores these on GenericClass)
         branding_logo_url = pd.get("logo_url") or pd.get("logoUrl")
         branding_hero_url = pd.get("hero_image_url") or pd.get("heroImageUrl") or pd.get("hero_url")
-        branding_bg = custom_color or pd.get("hexBackgroundColor") or pd.get("hex_background_color") or pd.get("background_color") or pd.get("base_color")
-        if isinstance(branding_bg, str) and branding_bg.strip():
-            branding_bg = branding_bg.strip()
-            if not branding_bg.startswith("#") and len(branding_bg) in [3, 6]:
-                branding_bg = f"#{branding_bg}"
-        else:
-            branding_bg = None
+        branding_bg = _hex_color(custom_color or pd.get("hexBackgroundColor") or pd.get("hex_background_color") or pd.get("background_color") or pd.get("base_color"))
         
         # Map local status to Google Wallet state
-        gw_state = "ACTIVE"
-        if status:
-            s_upper = status.upper()
-            if s_upper in ["ACTIVE", "COMPLETED", "EXPIRED", "INACTIVE"]:
-                gw_state = s_upper
+        gw_state = _object_state(status)
                 
         obj = {
             "id": object_id,
@@ -1383,68 +1984,36 @@ class WalletClient:
         # header_text → Google "header"
         fallback_header = header_text or pd.get("header") or pd.get("issuer_name") or holder_name or "Pass"
         if fallback_header:
-            obj["header"] = {
-                "defaultValue": {
-                    "language": "en-US",
-                    "value": str(fallback_header)
-                }
-            }
+            obj["header"] = _en_us(str(fallback_header))
 
         # card_title → Google "cardTitle" (large text on card)
         # Google Wallet requires cardTitle to be set for Generic passes
         fallback_title = card_title or pd.get("cardTitle") or pd.get("issuer_name") or header_text or holder_name or "Pass"
         if fallback_title:
-            obj["cardTitle"] = {
-                "defaultValue": {
-                    "language": "en-US",
-                    "value": str(fallback_title)
-                }
-            }
+            obj["cardTitle"] = _en_us(str(fallback_title))
         
         # subheader_value → Google "subheader"
         if isinstance(subheader_text, str) and subheader_text.strip():
-            obj["subheader"] = {
-                "defaultValue": {
-                    "language": "en-US",
-                    "value": subheader_text
-                }
-            }
+            obj["subheader"] = _en_us(subheader_text)
         
         # Add custom background color if provided
         if branding_bg:
             obj["hexBackgroundColor"] = branding_bg
 
-        if branding_logo_url and str(branding_logo_url).startswith(("http://", "https://")):
-            obj["logo"] = {
-                "sourceUri": {"uri": str(branding_logo_url)},
-                "contentDescription": {"defaultValue": {"language": "en-US", "value": "Logo"}}
-            }
-        if branding_hero_url and str(branding_hero_url).startswith(("http://", "https://")):
-            obj["heroImage"] = {
-                "sourceUri": {"uri": str(branding_hero_url)},
-                "contentDescription": {"defaultValue": {"language": "en-US", "value": "Hero Image"}}
-            }
+        logo_uri = str(branding_logo_url) if branding_logo_url else ""
+        if logo_uri.startswith(("http://", "https://")):
+            obj["logo"] = _image(logo_uri, "Logo")
+        hero_uri = str(branding_hero_url) if branding_hero_url else ""
+        if hero_uri.startswith(("http://", "https://")):
+            obj["heroImage"] = _image(hero_uri, "Hero Image")
         
         # Barcode support (minimal: type + value)
-        barcode_obj = None
-        if isinstance(pd.get("barcode"), dict):
-            barcode_obj = pd.get("barcode")
-        else:
-            bc_type = pd.get("barcode_type") or pd.get("barcodeType")
-            bc_value = pd.get("barcode_value") or pd.get("barcodeValue")
-            if (isinstance(bc_type, str) and bc_type.strip()) or (isinstance(bc_value, str) and bc_value.strip()):
-                barcode_obj = {
-                    "type": bc_type if bc_type else "QR_CODE",
-                    "value": bc_value if bc_value else "",
-                }
-                bc_alt = pd.get("barcode_alt_text") or pd.get("barcodeAltText")
-                if bc_alt:
-                    barcode_obj["alternateText"] = str(bc_alt)
-        if isinstance(barcode_obj, dict) and isinstance(barcode_obj.get("value"), str) and barcode_obj["value"].strip():
+        barcode_obj = _barcode(pd)
+        if barcode_obj:
             obj["barcode"] = barcode_obj
 
         # Messages support
-        user_messages = pd.get("messages")
+        user_messages = pd.get("messages") if include_messages else None
         if isinstance(user_messages, list) and user_messages:
             def _map_user_message(m):
                 if not isinstance(m, dict):
@@ -1461,12 +2030,8 @@ class WalletClient:
             mapped = [x for x in (_map_user_message(m) for m in user_messages) if x]
             if mapped:
                 obj["messages"] = mapped
-        elif message_type:
-            obj["messages"] = [{
-                "header": "Welcome",
-                "body": "Your pass has been created",
-                "messageType": message_type
-            }]
+        elif include_messages and message_type:
+            obj["messages"] = [dict(_WELCOME_MESSAGE, messageType=message_type)]
         
         if pass_data:
             
@@ -1475,10 +2040,11 @@ class WalletClient:
             # on the CLASS, not by moving data between module types.
             # Generic passes do NOT support infoModulesData for front-face display.
             all_raw_modules = (pass_data.get("textModulesData") or pass_data.get("text_modules", [])).copy()
-            if "description" in pass_data and pass_data["description"]:
+            description = pass_data.get("description")
+            if description:
                 all_raw_modules.append({
                     "header": "Description",
-                    "body": str(pass_data["description"]),
+                    "body": str(description),
                     "id": "description",
                     "module_type": "text"
                 })
@@ -1490,22 +2056,24 @@ class WalletClient:
             for m in all_raw_modules:
                 m_type = m.get("module_type", m.get("type", "text"))
                 m_body = str(m.get("body", "")).strip()
+                m_header = m.get("header", "")
+                m_id = m.get("id")
                 if m_type == "link":
                     if not m_body:
                         # Skip empty link, or fallback to text if header exists
-                        if m.get("header"):
-                            text_mod = {"header": m.get("header", ""), "body": ""}
-                            if m.get("id"): text_mod["id"] = m.get("id")
+                        if m_header:
+                            text_mod = {"header": m_header, "body": ""}
+                            if m_id: text_mod["id"] = m_id
                             text_mods.append(text_mod)
                         continue
                     uri = m_body if m_body.startswith(("http://", "https://", "mailto:", "tel:")) else f"https://{m_body}"
                     link_mod = {"uri": uri}
-                    if m.get("header"): link_mod["description"] = m.get("header")
-                    if m.get("id"): link_mod["id"] = m.get("id")
+                    if m_header: link_mod["description"] = m_header
+                    if m_id: link_mod["id"] = m_id
                     link_mods.append(link_mod)
                 else:
-                    text_mod = {"header": m.get("header", ""), "body": m_body}
-                    if m.get("id"): text_mod["id"] = m.get("id")
+                    text_mod = {"header": m_header, "body": m_body}
+                    if m_id: text_mod["id"] = m_id
                     text_mods.append(text_mod)
 
             # Always assign textModulesData and linksModuleData (even if empty) to ensure 
@@ -1516,26 +2084,7 @@ class WalletClient:
             obj["linksModuleData"] = {"uris": link_mods}
             
             # Add info modules for all other data (non-textModule fields)
-            info_label_values = []
-            
-            # Skip fields already used in header, cardTitle, subheader, or textModules
-            skip_fields = [
-                "card_title", "cardTitle", "header_value", "header", "subheader", 
-                "subheader_value", "description", "textModulesData", "messages", 
-                "messageType", "message_header", "message_body", "barcode", 
-                "barcode_type", "barcode_value", "barcode_alt_text", "barcodeAltText", "logo_url", "logoUrl", 
-                "hero_image_url", "heroImageUrl", "hero_url", "hexBackgroundColor", 
-                "hex_background_color", "background_color", "base_color",
-            ]
-            
-            for key, value in pass_data.items():
-                if value and key not in skip_fields:
-                    # Format key as label
-                    label = key.replace("_", " ").title()
-                    info_label_values.append({
-                        "label": label,
-                        "value": str(value)
-                    })
+            info_label_values = _info_label_values(pass_data, {}, _GENERIC_SKIP_FIELDS)
             
             if info_label_values:
                 obj["infoModulesData"] = [{
@@ -1546,4 +2095,24 @@ class WalletClient:
                     }]
                 }]
         
-        return obj
\ No newline at end of file
+        return obj
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_wallet_client():
+    """
+    Process-wide WalletClient, created on first use.
+
+    Each WalletClient carries its own executor and lookup caches (type
+    hints, negative cache, save links), so callers share one instance to
+    keep those warm across requests instead of rebuilding them.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = WalletClient()
+    return _client
@@ -0,0 +1,147 @@
+"""
+In-memory stand-in for the Google Wallet REST API at the transport level.
+
+FakeWalletHttp replaces the httpx transport under google-auth's
+AuthorizedHttp, so googleapiclient requests, /batch requests and the
+client's direct GET/PATCH calls all go through the real request code.
+"""
+
+import email.parser
+import json
+import threading
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import httplib2
+
+API_PREFIX = "/walletobjects/v1/"
+
+
+class FakeWalletHttp:
+    """
+    Serves Wallet resources from `resources` ("genericObject/<id>" -> dict).
+
+    - GET on a collection lists it, `page_size` at a time, with
+      `pagination.nextPageToken` and the `token` query parameter.
+    - POST to a collection inserts, answering 409 if the ID exists.
+    - PUT/PATCH on an existing resource replaces/merges it.
+    - `fail(method, path, *statuses)` makes the next calls to `path` (or
+      "batch" for the /batch endpoint itself) answer with those statuses;
+      an exception instance in place of a status is raised instead, as the
+      transport does when the connection fails.
+
+    `requests` records every HTTP round trip and `parts` every call sent
+    inside a /batch request, both as (method, path) pairs.
+    """
+
+    def __init__(self):
+        self.resources = {}
+        self.page_size = 100
+        self.requests = []
+        self.parts = []
+        self._failures = {}
+        self._lock = threading.Lock()
+
+    def fail(self, method, path, *statuses):
+        with self._lock:
+            self._failures.setdefault((method, path), []).extend(statuses)
+
+    def request(self, uri, method="GET", body=None, headers=None, **kwargs):
+        url = urlsplit(uri)
+        path = unquote(url.path)
+        if path == "/batch":
+            with self._lock:
+                self.requests.append((method, "batch"))
+            return self._batch(body, headers or {})
+
+        path = path[len(API_PREFIX):]
+        with self._lock:
+            self.requests.append((method, path))
+        status, payload = self._answer(method, path, parse_qs(url.query), body)
+        return _response(status), json.dumps(payload).encode("utf-8")
+
+    def _answer(self, method, path, query, body):
+        with self._lock:
+            queued = self._failures.get((method, path))
+            if queued:
+                status = queued.pop(0)
+                if isinstance(status, Exception):
+                    raise status
+                return status, {"error": {"code": status, "message": "injected failure"}}
+
+            if isinstance(body, bytes):
+                body = body.decode("utf-8")
+            is_collection = "/" not in path
+
+            if method == "GET" and is_collection:
+                return 200, self._list(path, query)
+            if method == "GET" and path in self.resources:
+                return 200, self.resources[path]
+            if method == "POST" and is_collection:
+                resource = json.loads(body)
+                key = f"{path}/{resource['id']}"
+                if key in self.resources:
+                    return 409, {"error": {"code": 409, "message": "already exists"}}
+                self.resources[key] = resource
+                return 200, resource
+            if method == "PUT" and path in self.resources:
+                self.resources[path] = json.loads(body)
+                return 200, self.resources[path]
+            if method == "PATCH" and path in self.resources:
+                self.resources[path].update(json.loads(body))
+                return 200, self.resources[path]
+            return 404, {"error": {"code": 404, "message": "not found"}}
+
+    def _list(self, collection, query):
+        class_id = query.get("classId", [None])[0]
+        matches = [
+            resource for key, resource in sorted(self.resources.items())
+            if key.startswith(collection + "/") and (class_id is None or resource.get("classId") == class_id)
+        ]
+        start = int(query.get("token", ["0"])[0])
+        end = start + self.page_size
+        response = {"resources": matches[start:end]}
+        if end < len(matches):
+            response["pagination"] = {"nextPageToken": str(end)}
+        return response
+
+    def _batch(self, body, headers):
+        with self._lock:
+            queued = self._failures.get(("POST", "batch"))
+            if queued:
+                status = queued.pop(0)
+                if isinstance(status, Exception):
+                    raise status
+                return _response(status), b'{"error": {"code": %d}}' % status
+
+        if isinstance(body, bytes):
+            body = body.decode("utf-8")
+        envelope = email.parser.Parser().parsestr(
+            f"Content-Type: {headers['content-type']}\r\n\r\n{body}"
+        )
+
+        parts = []
+        for part in envelope.get_payload():
+            content_id = part["Content-ID"].strip("<>")
+            request_line, _, rest = part.get_payload().partition("\n")
+            method, target, _ = request_line.split(" ", 2)
+            _, _, part_body = rest.replace("\r\n", "\n").partition("\n\n")
+            url = urlsplit(target)
+            path = unquote(url.path)[len(API_PREFIX):]
+            with self._lock:
+                self.parts.append((method, path))
+            status, payload = self._answer(method, path, parse_qs(url.query), part_body.strip() or None)
+            parts.append(
+                "--BOUNDARY\r\n"
+                "Content-Type: application/http\r\n"
+                f"Content-ID: <response-{content_id}>\r\n\r\n"
+                f"HTTP/1.1 {status} FAKE\r\n"
+                "Content-Type: application/json\r\n\r\n"
+                f"{json.dumps(payload)}\r\n"
+            )
+        content = "".join(parts) + "--BOUNDARY--"
+        resp = httplib2.Response({"status": 200, "content-type": "multipart/mixed; boundary=BOUNDARY"})
+        return resp, content.encode("utf-8")
+
+
+def _response(status):
+    return httplib2.Response({"status": status, "content-type": "application/json"})
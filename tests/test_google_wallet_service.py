@@ -0,0 +1,402 @@
+"""
+WalletClient behaviour against an in-memory Wallet API (see fake_wallet_http).
+
+Run from the repository root:  python -m unittest discover -s tests
+"""
+
+import base64
+import datetime
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+from google.oauth2 import service_account
+from googleapiclient.errors import HttpError
+
+import configs
+from exceptions import GoogleWalletAPIError, GoogleWalletNotFoundError
+from services import google_wallet_service as gws
+from tests.fake_wallet_http import FakeWalletHttp
+
+ISSUER_ID = "3388000000000000001"
+
+_private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+_key_file = None
+
+
+def setUpModule():
+    global _key_file
+    pem = _private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode("utf-8")
+    fd, _key_file = tempfile.mkstemp(suffix=".json")
+    with os.fdopen(fd, "w") as f:
+        json.dump({
+            "type": "service_account",
+            "project_id": "wallet-test",
+            "private_key_id": "test-key",
+            "private_key": pem,
+            "client_email": "wallet@wallet-test.iam.gserviceaccount.com",
+            "client_id": "1",
+            "token_uri": "https://oauth2.googleapis.com/token",
+        }, f)
+
+
+def tearDownModule():
+    os.remove(_key_file)
+
+
+def _fake_refresh(credentials, request):
+    credentials.token = "test-token"
+    credentials.expiry = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None) + datetime.timedelta(hours=1)
+
+
+def _b64url_decode(segment):
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+class _Clock:
+    """Controllable stand-in for time.monotonic."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class WalletClientTestCase(unittest.TestCase):
+    def setUp(self):
+        self.http = FakeWalletHttp()
+        self.clock = _Clock()
+        patches = [
+            mock.patch.object(configs, "ISSUER_ID", ISSUER_ID),
+            mock.patch.object(configs, "KEY_FILE_PATH", _key_file),
+            mock.patch.object(gws, "_HttpxTransport", lambda: self.http),
+            mock.patch.object(service_account.Credentials, "refresh", _fake_refresh),
+            mock.patch.object(gws.time, "sleep", lambda seconds: None),
+            mock.patch.object(gws.time, "monotonic", self.clock),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        for cached in (gws._service_account_info, gws._signing_key, gws._get_service,
+                       gws._get_resources, gws._ids_to_try):
+            cached.cache_clear()
+            self.addCleanup(cached.cache_clear)
+        self.client = gws.WalletClient()
+        self.addCleanup(self.client._executor.shutdown)
+
+    def add(self, collection, suffix, **fields):
+        resource = {"id": f"{ISSUER_ID}.{suffix}", **fields}
+        self.http.resources[f"{collection}/{resource['id']}"] = resource
+        return resource
+
+
+class ProbeTests(WalletClientTestCase):
+    def test_cold_lookup_is_one_batch_then_hinted_lookup_is_one_get(self):
+        loyalty = self.add("loyaltyObject", "o1")
+
+        self.assertEqual(self.client.get_object("o1"), loyalty)
+        self.assertEqual(self.http.requests, [("POST", "batch")])
+
+        self.http.requests.clear()
+        self.assertEqual(self.client.get_object("o1"), loyalty)
+        self.assertEqual(self.http.requests, [("GET", f"loyaltyObject/{ISSUER_ID}.o1")])
+
+    def test_expected_type_is_tried_alone_first(self):
+        self.add("eventTicketObject", "o1")
+
+        self.client.get_object("o1", class_type="EventTicket")
+
+        self.assertEqual(self.http.requests, [("GET", f"eventTicketObject/{ISSUER_ID}.o1")])
+
+    def test_stale_hint_falls_back_to_the_batched_probe(self):
+        self.add("loyaltyObject", "o1")
+        self.client.get_object("o1")
+        moved = self.http.resources.pop(f"loyaltyObject/{ISSUER_ID}.o1")
+        self.http.resources[f"genericObject/{ISSUER_ID}.o1"] = moved
+
+        self.assertEqual(self.client.get_object("o1"), moved)
+        self.assertEqual(self.client._type_hints["object"].get(f"{ISSUER_ID}.o1"), "Generic")
+
+    def test_miss_raises_404_and_is_remembered(self):
+        with self.assertRaises(HttpError) as first:
+            self.client.get_object("missing")
+        self.assertEqual(first.exception.resp.status, 404)
+        self.http.requests.clear()
+
+        with self.assertRaises(HttpError) as second:
+            self.client.get_object("missing")
+
+        self.assertEqual(second.exception.resp.status, 404)
+        self.assertIsNot(second.exception, first.exception)
+        self.assertEqual(self.http.requests, [])
+
+    def test_invalid_id_is_rejected_without_network(self):
+        with self.assertRaises(GoogleWalletNotFoundError):
+            self.client.get_object("not a valid id")
+        self.assertEqual(self.http.requests, [])
+
+    def test_failed_batch_falls_back_to_individual_gets(self):
+        generic = self.add("genericObject", "o1")
+        self.http.fail("POST", "batch", 503)
+
+        self.assertEqual(self.client.get_object("o1"), generic)
+        self.assertIn(("GET", f"genericObject/{ISSUER_ID}.o1"), self.http.requests)
+
+    def test_batch_transport_error_falls_back_to_individual_gets(self):
+        generic = self.add("genericObject", "o1")
+        self.http.fail("POST", "batch", ConnectionError("connection reset"))
+
+        self.assertEqual(self.client.get_object("o1"), generic)
+        self.assertIn(("GET", f"genericObject/{ISSUER_ID}.o1"), self.http.requests)
+
+    def test_transient_part_failure_is_retried(self):
+        loyalty = self.add("loyaltyObject", "o1")
+        self.http.fail("GET", f"loyaltyObject/{ISSUER_ID}.o1", 503)
+
+        self.assertEqual(self.client.get_object("o1"), loyalty)
+
+    def test_non_miss_error_is_raised(self):
+        self.add("genericObject", "o1")
+        self.http.fail("GET", f"genericObject/{ISSUER_ID}.o1", 403)
+
+        with self.assertRaises(HttpError) as raised:
+            self.client.get_object("o1")
+        self.assertEqual(raised.exception.resp.status, 403)
+
+    def test_find_object_reports_the_serving_type(self):
+        self.add("giftCardObject", "o1")
+
+        wallet_object, class_type = self.client.find_object("o1")
+
+        self.assertEqual(wallet_object["id"], f"{ISSUER_ID}.o1")
+        self.assertEqual(class_type, "GiftCard")
+        with self.assertRaises(GoogleWalletNotFoundError):
+            self.client.find_object("missing")
+
+
+class ClassCacheTests(WalletClientTestCase):
+    def test_class_is_served_from_cache_until_ttl_expires(self):
+        self.add("genericClass", "c1", issuerName="Issuer")
+        self.client.get_class("c1")
+        self.http.requests.clear()
+
+        self.client.get_class("c1")
+        self.assertEqual(self.http.requests, [])
+
+        self.clock.now += gws.CLASS_CACHE_TTL + 1
+        self.client.get_class("c1")
+        self.assertEqual(self.http.requests, [("GET", f"genericClass/{ISSUER_ID}.c1")])
+
+    def test_forget_class_drops_cached_class_and_cached_miss(self):
+        self.add("genericClass", "c1", issuerName="Old")
+        self.client.get_class("c1")
+        self.http.resources[f"genericClass/{ISSUER_ID}.c1"]["issuerName"] = "New"
+
+        self.client._forget_class("c1")
+
+        self.assertEqual(self.client.get_class("c1")["issuerName"], "New")
+
+        with self.assertRaises(GoogleWalletNotFoundError):
+            self.client.get_class("c2")
+        self.add("genericClass", "c2")
+        self.client._forget_class("c2")
+        self.assertEqual(self.client.get_class("c2")["id"], f"{ISSUER_ID}.c2")
+
+    def test_cached_class_miss_raises_fresh_errors(self):
+        errors = []
+        for _ in range(2):
+            with self.assertRaises(GoogleWalletNotFoundError) as raised:
+                self.client.get_class("missing")
+            errors.append(raised.exception)
+
+        self.assertIsNot(errors[0], errors[1])
+        self.assertEqual(str(errors[0]), str(errors[1]))
+        self.assertEqual(len(self.http.requests), 1)
+
+
+class TTLCacheTests(unittest.TestCase):
+    def test_entries_expire_and_size_is_bounded(self):
+        clock = _Clock()
+        with mock.patch.object(gws.time, "monotonic", clock):
+            cache = gws._TTLCache(maxsize=2, ttl=10)
+            cache.set("a", 1)
+            cache.set("b", 2)
+            self.assertEqual(cache.get("a"), 1)
+            cache.set("c", 3)  # evicts "b", the least recently used
+            self.assertIsNone(cache.get("b"))
+            self.assertEqual(cache.get("a"), 1)
+
+            clock.now += 11
+            self.assertIsNone(cache.get("a"))
+            self.assertEqual(cache.get("c", "default"), "default")
+
+
+class RetryTests(WalletClientTestCase):
+    def test_rate_limited_update_is_retried(self):
+        self.add("genericClass", "c1", issuerName="Old")
+        self.http.fail("PATCH", f"genericClass/{ISSUER_ID}.c1", 429, 503)
+
+        self.client.update_pass_class("c1", {"issuerName": "New"})
+
+        self.assertEqual(self.http.resources[f"genericClass/{ISSUER_ID}.c1"]["issuerName"], "New")
+
+    def test_insert_is_not_retried_on_server_error(self):
+        self.http.fail("POST", "genericObject", 503)
+
+        with self.assertRaises(GoogleWalletAPIError) as raised:
+            self.client.create_pass_object({"id": f"{ISSUER_ID}.o1"}, class_type="Generic")
+
+        self.assertEqual(raised.exception.status_code, 503)
+        self.assertEqual(self.http.requests.count(("POST", "genericObject")), 1)
+
+    def test_retry_after_header_is_honoured(self):
+        error = HttpError(gws.httplib2.Response({"status": 429, "retry-after": "3"}), b"{}")
+        self.assertEqual(gws._retry_delay(error, attempt=0), 3.0)
+
+
+class SaveLinkJwtTests(WalletClientTestCase):
+    def test_token_is_a_valid_rs256_jwt(self):
+        claims = {"iss": "wallet@test", "aud": "google", "typ": "savetowallet",
+                  "payload": {"genericObjects": [{"id": "x", "name": "é"}]}}
+
+        token = gws._encode_jwt(claims)
+
+        header, payload, signature = token.split(".")
+        self.assertEqual(json.loads(_b64url_decode(header)), {"alg": "RS256", "typ": "JWT"})
+        self.assertEqual(json.loads(_b64url_decode(payload)), claims)
+        _private_key.public_key().verify(
+            _b64url_decode(signature), f"{header}.{payload}".encode("ascii"),
+            padding.PKCS1v15(), hashes.SHA256(),
+        )
+
+    def test_save_link_embeds_prefixed_ids(self):
+        link = self.client.generate_save_link("o1", class_type="LoyaltyCard", class_id="c1")
+
+        token = link.rsplit("/", 1)[1]
+        claims = json.loads(_b64url_decode(token.split(".")[1]))
+        self.assertEqual(claims["payload"], {
+            "loyaltyObjects": [{"id": f"{ISSUER_ID}.o1", "classId": f"{ISSUER_ID}.c1"}]
+        })
+        self.assertLessEqual(claims["iat"], int(time.time()))
+
+
+class ListTests(WalletClientTestCase):
+    def setUp(self):
+        super().setUp()
+        self.http.page_size = 2
+
+    def test_list_follows_page_tokens(self):
+        for i in range(5):
+            self.add("genericObject", f"o{i}", classId=f"{ISSUER_ID}.c1")
+        self.add("genericObject", "other", classId=f"{ISSUER_ID}.c2")
+
+        objects = self.client.list_class_objects("c1")
+
+        self.assertEqual(sorted(o["id"] for o in objects), [f"{ISSUER_ID}.o{i}" for i in range(5)])
+        generic_pages = [part for part in self.http.parts if part == ("GET", "genericObject")]
+        self.assertEqual(len(generic_pages), 3)
+
+    def test_list_all_classes_across_types(self):
+        self.add("genericClass", "g1")
+        self.add("genericClass", "g2")
+        self.add("genericClass", "g3")
+        self.add("loyaltyClass", "l1")
+
+        classes = self.client.list_all_classes()
+
+        self.assertEqual(
+            sorted((c["class_type"], c["id"]) for c in classes),
+            [("Generic", f"{ISSUER_ID}.g1"), ("Generic", f"{ISSUER_ID}.g2"),
+             ("Generic", f"{ISSUER_ID}.g3"), ("LoyaltyCard", f"{ISSUER_ID}.l1")],
+        )
+
+    def test_failed_batch_falls_back_to_individual_lists(self):
+        self.add("genericClass", "g1")
+        self.add("loyaltyClass", "l1")
+        self.http.fail("POST", "batch", 503)
+
+        classes = self.client.list_all_classes()
+
+        self.assertEqual(sorted(c["id"] for c in classes), [f"{ISSUER_ID}.g1", f"{ISSUER_ID}.l1"])
+
+    def test_connection_error_after_failed_batch_skips_only_that_call(self):
+        self.add("genericClass", "g1")
+        self.add("loyaltyClass", "l1")
+        self.add("genericObject", "o1", classId=f"{ISSUER_ID}.g1")
+        self.http.fail("POST", "batch", 503)
+        self.http.fail("GET", "loyaltyClass", ConnectionError("connection reset"))
+
+        classes = self.client.list_all_classes()
+
+        self.assertEqual([c["id"] for c in classes], [f"{ISSUER_ID}.g1"])
+
+        # Both the class listing and the object listing batches fail
+        self.http.fail("POST", "batch", 503, 503)
+        self.http.fail("GET", "loyaltyObject", TimeoutError("timed out"))
+
+        objects = self.client.list_all_pass_objects()
+
+        self.assertEqual([o["id"] for o in objects], [f"{ISSUER_ID}.o1"])
+
+    def test_transient_part_failure_only_retries_that_call(self):
+        self.add("genericClass", "g1")
+        self.add("loyaltyClass", "l1")
+        self.http.fail("GET", "loyaltyClass", 503)
+
+        classes = self.client.list_all_classes()
+
+        self.assertEqual(sorted(c["id"] for c in classes), [f"{ISSUER_ID}.g1", f"{ISSUER_ID}.l1"])
+        self.assertEqual(self.http.requests.count(("GET", "genericClass")), 0)
+
+    def test_failed_later_page_keeps_collected_pages(self):
+        for i in range(3):
+            self.add("genericClass", f"g{i}")
+        self.add("loyaltyClass", "l1")
+        original = self.http._answer
+
+        # The first page of genericClass succeeds, the follow-up page fails
+        def fail_second_generic_page(method, path, query, body):
+            if path == "genericClass" and "token" in query:
+                return 400, {"error": {"code": 400}}
+            return original(method, path, query, body)
+
+        with mock.patch.object(self.http, "_answer", fail_second_generic_page), \
+                self.assertLogs(gws.logger, "WARNING") as logs:
+            results = self.client.list_all_classes()
+
+        self.assertEqual(
+            sorted(c["id"] for c in results),
+            [f"{ISSUER_ID}.g0", f"{ISSUER_ID}.g1", f"{ISSUER_ID}.l1"],
+        )
+        self.assertTrue(any("partial" in line for line in logs.output))
+
+    def test_list_all_pass_objects_survives_one_failing_class(self):
+        self.add("genericClass", "c1")
+        self.add("genericClass", "c2")
+        self.add("genericObject", "o1", classId=f"{ISSUER_ID}.c1")
+        self.add("genericObject", "o2", classId=f"{ISSUER_ID}.c2")
+        original = self.http._answer
+
+        def fail_c2(method, path, query, body):
+            if path == "genericObject" and query.get("classId") == [f"{ISSUER_ID}.c2"]:
+                return 500, {"error": {"code": 500}}
+            return original(method, path, query, body)
+
+        with mock.patch.object(self.http, "_answer", fail_c2):
+            objects = self.client.list_all_pass_objects()
+
+        self.assertEqual([o["id"] for o in objects], [f"{ISSUER_ID}.o1"])
+
+
+if __name__ == "__main__":
+    unittest.main()